@@ -7,6 +7,7 @@ from tkinter import Tk, Button, Label, Text, filedialog, StringVar, END, message
 from tkinter.ttk import Combobox
 
 from openpyxl import load_workbook, Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill
 
 import matplotlib.pyplot as plt
@@ -100,11 +101,10 @@ def replace_zero_in_workbook(wb):
 
 
 def delete_rows_if_E_last_digit_not_zero(ws):
-    rows_to_delete = []
-
-    for row_idx in range(2, ws.max_row + 1):
-        value = ws.cell(row=row_idx, column=5).value
+    rows_to_delete = set()
 
+    # E열만 한 번에 순회 (행마다 ws.cell 조회하지 않음)
+    for row_idx, (value,) in enumerate(ws.iter_rows(min_row=2, min_col=5, max_col=5, values_only=True), start=2):
         if value is None:
             continue
 
@@ -116,10 +116,23 @@ def delete_rows_if_E_last_digit_not_zero(ws):
         last_char = s[-1]
 
         if last_char.isdigit() and last_char != "0":
-            rows_to_delete.append(row_idx)
+            rows_to_delete.add(row_idx)
+
+    if not rows_to_delete:
+        return
+
+    # 한 행씩 delete_rows 하면 매번 아래 셀 전체가 당겨지므로,
+    # 남길 행 값만 모아 본문을 한 번 비우고 다시 채움 (1단계에서 만든 값 전용 시트)
+    kept_rows = [
+        row
+        for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2)
+        if row_idx not in rows_to_delete
+    ]
 
-    for row_idx in reversed(rows_to_delete):
-        ws.delete_rows(row_idx)
+    ws.delete_rows(2, ws.max_row)
+
+    for row in kept_rows:
+        ws.append(row)
 
 
 def get_break_count(spoolno):
@@ -246,9 +259,8 @@ class ExcelApp:
     def calc_column_avg(self, ws, col_idx):
         nums = []
 
-        for row_idx in range(2, ws.max_row + 1):
-            value = ws.cell(row=row_idx, column=col_idx).value
-
+        # 해당 열만 한 번에 순회 (행마다 ws.cell 조회하지 않음)
+        for (value,) in ws.iter_rows(min_row=2, min_col=col_idx, max_col=col_idx, values_only=True):
             if is_number(value):
                 nums.append(value)
 
@@ -286,6 +298,7 @@ class ExcelApp:
                 group_by_2char[group_name].append(row)
 
             self.log("alls.xlsx 내부 그룹 시트 생성 실행중입니다.")
+            sheet_rows = {}
 
             for group_name, group_rows in group_by_2char.items():
                 sheet_name = safe_sheet_name(group_name)
@@ -299,18 +312,18 @@ class ExcelApp:
                 for row in group_rows:
                     ws.append(row)
 
+                # 시트에 쓴 행을 그대로 기억 (같은 시트 이름이면 마지막 그룹이 남는 것도 시트와 동일)
+                sheet_rows[sheet_name] = group_rows
+
             wb.save(self.input_file)
 
             self.log("그룹별 xlsx 파일 생성 실행중입니다.")
             self.created_files = []
 
             for group_name in group_by_2char.keys():
-                group_sheet_name = safe_sheet_name(group_name)
-                group_ws = wb[group_sheet_name]
-
-                group_rows_all = list(group_ws.iter_rows(values_only=True))
-                group_header = group_rows_all[0]
-                group_data_rows = group_rows_all[1:]
+                # 방금 만든 그룹 시트를 다시 읽지 않고 메모리의 행을 사용
+                group_header = header
+                group_data_rows = sheet_rows[safe_sheet_name(group_name)]
 
                 sub_groups = defaultdict(list)
 
@@ -319,8 +332,8 @@ class ExcelApp:
                     sub_sheet_name = "Blank" if value is None else str(value)
                     sub_groups[sub_sheet_name].append(row)
 
-                new_wb = Workbook()
-                new_wb.remove(new_wb.active)
+                # 행 추가만 하는 출력 파일 → write-only 모드로 스트리밍 저장
+                new_wb = Workbook(write_only=True)
 
                 for sub_name, sub_rows in sub_groups.items():
                     ws_name = safe_sheet_name(sub_name)
@@ -441,9 +454,9 @@ class ExcelApp:
             target_wb.save(selected_file)
 
             self.log("Report 파일 작성 실행중입니다.")
-            report_wb = Workbook()
-            report_ws = report_wb.active
-            report_ws.title = "Report"
+            # Report는 행 추가만 하므로 write-only 모드로 작성 (오류 행만 채우기 서식 셀 사용)
+            report_wb = Workbook(write_only=True)
+            report_ws = report_wb.create_sheet("Report")
 
             report_header = ["Sheet Name"] + [item[0] for item in mapping] + ["단선 횟수", "hdate"]
             report_ws.append(report_header)
@@ -484,37 +497,41 @@ class ExcelApp:
                 hdate_value = ws.cell(row=avg_row_idx, column=1).value
                 report_row.append(hdate_value)
 
-                report_ws.append(report_row)
-
-                current_row = report_ws.max_row
-                a_value = report_ws.cell(row=current_row, column=1).value
+                # 검사는 시트를 다시 읽지 않고 방금 만든 행 값으로 수행 (열 번호 n → report_row[n - 1])
+                a_value = report_row[0]
                 row_error_messages = []
 
-                val_L = report_ws.cell(row=current_row, column=12).value
-                val_M = report_ws.cell(row=current_row, column=13).value
+                val_L = report_row[11]
+                val_M = report_row[12]
 
                 if check_range(val_L, 8.8, 9.2) or check_range(val_M, 8.8, 9.2):
                     row_error_messages.append(f"{a_value}->MFD 오류 발생")
 
-                val_W = report_ws.cell(row=current_row, column=23).value
+                val_W = report_row[22]
 
                 if is_number(val_W) and val_W < 0:
                     row_error_messages.append(f"{a_value}->Cutoff delta2m-22m 오류 발생")
 
-                val_Y = report_ws.cell(row=current_row, column=25).value
-                val_Z = report_ws.cell(row=current_row, column=26).value
+                val_Y = report_row[24]
+                val_Z = report_row[25]
 
                 if check_range(val_Y, 124.3, 125.7) or check_range(val_Z, 124.3, 125.7):
                     row_error_messages.append(f"{a_value}->Clad Dia. 오류 발생")
 
-                val_AH = report_ws.cell(row=current_row, column=34).value
+                val_AH = report_row[33]
 
                 if check_range(val_AH, 0.073, 0.09):
                     row_error_messages.append(f"{a_value}->disp slope at ZDW 오류 발생")
 
                 if row_error_messages:
-                    for col in range(1, report_ws.max_column + 1):
-                        report_ws.cell(row=current_row, column=col).fill = red_fill
+                    red_cells = []
+
+                    for value in report_row:
+                        cell = WriteOnlyCell(report_ws, value=value)
+                        cell.fill = red_fill
+                        red_cells.append(cell)
+
+                    report_ws.append(red_cells)
 
                     for msg in row_error_messages:
                         now = datetime.now()
@@ -523,6 +540,8 @@ class ExcelApp:
                             "time": now,
                             "msg": msg
                         })
+                else:
+                    report_ws.append(report_row)
 
             report_file = os.path.join(self.output_dir, f"{selected}_report.xlsx")
             report_wb.save(report_file)
@@ -567,10 +586,12 @@ class ExcelApp:
             report_ws = wb["Report"]
 
             hdate_col = report_ws.max_column
+            header = next(report_ws.iter_rows(min_row=1, max_row=1, values_only=True))
             monthly_rows = {}
 
-            for row_idx in range(2, report_ws.max_row + 1):
-                hdate = report_ws.cell(row=row_idx, column=hdate_col).value
+            # Report 시트를 한 번만 순회하며 행 값(tuple)을 월별로 모음
+            for row in report_ws.iter_rows(min_row=2, values_only=True):
+                hdate = row[hdate_col - 1]
 
                 if hdate is None:
                     continue
@@ -586,7 +607,7 @@ class ExcelApp:
                 if month_key not in monthly_rows:
                     monthly_rows[month_key] = []
 
-                monthly_rows[month_key].append(row_idx)
+                monthly_rows[month_key].append(row)
 
             if not monthly_rows:
                 self.log("월별로 분류할 hdate 값이 없습니다.")
@@ -595,7 +616,7 @@ class ExcelApp:
             monthly_summary = []
 
             for month_key in sorted(monthly_rows.keys()):
-                row_indices = monthly_rows[month_key]
+                month_rows = monthly_rows[month_key]
                 sheet_name = safe_sheet_name(month_key)
 
                 if sheet_name in wb.sheetnames:
@@ -603,15 +624,11 @@ class ExcelApp:
 
                 month_ws = wb.create_sheet(sheet_name)
 
-                for col in range(1, report_ws.max_column + 1):
-                    month_ws.cell(row=1, column=col).value = report_ws.cell(row=1, column=col).value
-
-                new_row = 2
+                # 셀 단위 복사 대신 모아 둔 행 값을 그대로 추가
+                month_ws.append(header)
 
-                for row_idx in row_indices:
-                    for col in range(1, report_ws.max_column + 1):
-                        month_ws.cell(row=new_row, column=col).value = report_ws.cell(row=row_idx, column=col).value
-                    new_row += 1
+                for row in month_rows:
+                    month_ws.append(row)
 
                 avg_H = self.calc_column_avg(month_ws, 8)
                 avg_I = self.calc_column_avg(month_ws, 9)
@@ -3,18 +3,20 @@
 """
 PC 전용 실행앱 (Tkinter) — app.py
 - ab.xlsx / alls.xlsx 선택 → [실행] → new_main.py(run-all) 실행
-- 표준출력 실시간 표시(-u, PYTHONUNBUFFERED, UTF-8)
+- 개발환경: 같은 프로세스의 백그라운드 스레드에서 new_main.main(argv) 직접 호출
+  (자식 인터프리터 기동/pandas 재임포트 없음, print 출력은 큐로 받아 실시간 표시)
 - EXE(onefile)일 때는 --worker 모드로 자기 자신을 실행하여 내부에서
   new_main을 모듈로 import → main(argv) 호출(자기 재실행 문제 해결)
 """
 
-import os, sys, threading, queue, subprocess, importlib.util
+import os, sys, threading, queue, subprocess, importlib.util, multiprocessing, contextlib, codecs
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 APP_TITLE = "Integrated Fiber Analyzer - Runner"
 DEFAULT_WIDTH, DEFAULT_HEIGHT = 1080, 700
+MAX_LOG_LINES = 5000  # 로그 창에 남길 최대 줄 수 (전체 로그는 new_main의 logs/run_*.txt에 기록됨)
 
 # ─────────────────────────────────────────────────────────────
 # new_main.py 위치 탐색 (개발/EXE 모두 지원) — 못 찾으면 None
@@ -46,14 +48,8 @@ def _run_new_main_module(mod, argv: list[str]) -> int:
             return 5
     return 0  # main 없음 → 이미 실행된 형태일 수 있음
 
-def run_worker(argv: list[str]) -> int:
-    """
-    argv: new_main.py 에게 전달할 인자 리스트
-          예: ["--ab", "...", "--alls", "...", "run-all"]
-    """
-    # argparse가 기대하는 argv 구성
-    sys.argv = ["new_main.py"] + argv
-
+def _load_new_main_module():
+    """new_main 모듈 로드 → (모듈, 0) 또는 실패 시 (None, 오류코드)"""
     # 1) EXE(onefile)일 때: 모듈 import 우선 (PyInstaller가 모듈로 포함)
     if getattr(sys, "frozen", False):
         try:
@@ -61,28 +57,61 @@ def run_worker(argv: list[str]) -> int:
         except Exception as e:
             print(f"[worker] module import error: {e}", flush=True)
         else:
-            return _run_new_main_module(mod, argv)
+            return mod, 0
 
     # 2) 개발환경 또는 모듈 import 실패 시: 파일 경로 로드 폴백
     if NEW_MAIN is None:
         print("[worker] new_main.py not found", flush=True)
-        return 2
+        return None, 2
 
     spec = importlib.util.spec_from_file_location("new_main", str(NEW_MAIN))
     if spec is None or spec.loader is None:
         print("[worker] spec/loader is None", flush=True)
-        return 3
+        return None, 3
     mod = importlib.util.module_from_spec(spec)
+    sys.modules["new_main"] = mod  # dataclass 등이 sys.modules에서 모듈을 찾으므로 먼저 등록
     try:
         spec.loader.exec_module(mod)  # type: ignore[attr-defined]
     except SystemExit as e:
-        return int(getattr(e, "code", 0) or 0)
+        sys.modules.pop("new_main", None)
+        return None, int(getattr(e, "code", 0) or 0)
     except Exception as e:
+        sys.modules.pop("new_main", None)
         print(f"[worker] import error (file path): {e}", flush=True)
-        return 4
+        return None, 4
+    return mod, 0
 
+def run_worker(argv: list[str]) -> int:
+    """
+    argv: new_main.py 에게 전달할 인자 리스트
+          예: ["--ab", "...", "--alls", "...", "run-all"]
+    """
+    # argparse가 기대하는 argv 구성
+    sys.argv = ["new_main.py"] + argv
+
+    mod, rc = _load_new_main_module()
+    if mod is None:
+        return rc
     return _run_new_main_module(mod, argv)
 
+# ─────────────────────────────────────────────────────────────
+# 인프로세스 실행용: print 출력을 UI 큐로 넘기는 stdout 대체 객체
+# ─────────────────────────────────────────────────────────────
+class _QueueWriter:
+    def __init__(self, q: "queue.Queue[str]"):
+        self.q = q
+
+    def write(self, s: str) -> int:
+        if s:
+            self.q.put(s)
+        return len(s)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
 # ─────────────────────────────────────────────────────────────
 # Tk 앱
 # ─────────────────────────────────────────────────────────────
@@ -95,8 +124,10 @@ class RunnerApp(tk.Tk):
 
         self._build_ui()
         self.proc: subprocess.Popen | None = None
+        self.worker_mod = None  # 인프로세스 실행 중인 new_main 모듈
         self.queue: "queue.Queue[str]" = queue.Queue()
-        self.after(50, self._poll_queue)
+        self._polling = False  # 실행 중에만 큐 폴링 (대기 중에는 타이머 없음)
+        self.reader: threading.Thread | None = None
 
     # UI
     def _build_ui(self):
@@ -138,7 +169,12 @@ class RunnerApp(tk.Tk):
 
     # 로그
     def _append_log(self, s: str):
-        self.txt.insert(tk.END, s); self.txt.see(tk.END)
+        self.txt.insert(tk.END, s)
+        # 줄 수가 커지면 Text 위젯이 느려지므로 오래된 줄부터 잘라냄
+        lines = int(self.txt.index("end-1c").split(".")[0])
+        if lines > MAX_LOG_LINES:
+            self.txt.delete("1.0", f"{lines - MAX_LOG_LINES + 1}.0")
+        self.txt.see(tk.END)
 
     def _enable_controls(self, running: bool):
         self.btn_run.config(state=(tk.DISABLED if running else tk.NORMAL))
@@ -166,6 +202,17 @@ class RunnerApp(tk.Tk):
         self._append_log(f"스크립트: {NEW_MAIN}\n")
         self._append_log(f"인자: {' '.join(child_argv)}\n\n")
 
+        run_cwd = (NEW_MAIN.parent if NEW_MAIN else Path.cwd())  # 결과/로그 위치 일관
+
+        if not getattr(sys, "frozen", False):
+            # Python: 같은 프로세스에서 new_main.main(argv) 호출 (인터프리터 기동/재임포트 생략)
+            self._append_log("실행 방식: 인프로세스 (new_main.main 직접 호출)\n\n")
+            self._enable_controls(True)
+            self.status.set("실행 중…")
+            threading.Thread(target=self._inprocess_thread, args=(child_argv, run_cwd), daemon=True).start()
+            self._start_polling()
+            return
+
         try:
             env = os.environ.copy()
             env.update({
@@ -173,24 +220,17 @@ class RunnerApp(tk.Tk):
                 "PYTHONIOENCODING": "utf-8",
                 "PYTHONUTF8": "1",
             })
-            run_cwd = (NEW_MAIN.parent if NEW_MAIN else Path.cwd())  # 결과/로그 위치 일관
 
-            if getattr(sys, "frozen", False):
-                # EXE: 같은 exe를 --worker 모드로 실행 → 내부에서 new_main.main(argv) 수행
-                cmd = [sys.executable, "--worker", *child_argv]
-            else:
-                # Python: 해석기로 직접 실행
-                cmd = [sys.executable, "-u", str(NEW_MAIN), *child_argv]
+            # EXE: 같은 exe를 --worker 모드로 실행 → 내부에서 new_main.main(argv) 수행
+            cmd = [sys.executable, "--worker", *child_argv]
 
             self._append_log("실행 커맨드: " + " ".join(cmd) + "\n\n")
 
+            # 출력은 바이너리 파이프로 받아 리더 스레드에서 청크 단위로 UTF-8 디코딩
             self.proc = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True, universal_newlines=True,
-                encoding="utf-8", errors="replace",  # cp949 이슈 방지
-                bufsize=1,
                 env=env, cwd=str(run_cwd),
             )
         except Exception as e:
@@ -198,23 +238,70 @@ class RunnerApp(tk.Tk):
 
         self._enable_controls(True)
         self.status.set("실행 중…")
-        threading.Thread(target=self._reader_thread, daemon=True).start()
+        self.reader = threading.Thread(target=self._reader_thread, daemon=True)
+        self.reader.start()
         threading.Thread(target=self._waiter_thread, daemon=True).start()
+        self._start_polling()
 
     # 중지
     def _on_stop(self):
+        if self.worker_mod is not None:
+            # 인프로세스: 스레드는 강제 종료할 수 없으므로 현재 단계 종료 후 중지
+            stop_event = getattr(self.worker_mod, "STOP_EVENT", None)
+            if stop_event is not None:
+                stop_event.set()
+            self.btn_stop.config(state=tk.DISABLED)
+            self.status.set("중지 요청 (현재 단계 완료 후 중지)")
+            return
         if self.proc and self.proc.poll() is None:
             try: self.proc.terminate()
             except Exception: pass
         self._enable_controls(False)
         self.status.set("중지 요청")
 
+    # 인프로세스 실행 스레드
+    def _inprocess_thread(self, argv: list[str], run_cwd: Path):
+        writer = _QueueWriter(self.queue)
+        rc = 1
+        prev_cwd = os.getcwd()
+        try:
+            os.chdir(run_cwd)
+            with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
+                mod, rc = _load_new_main_module()
+                if mod is not None:
+                    self.worker_mod = mod
+                    rc = _run_new_main_module(mod, argv)
+        except Exception as e:
+            self.queue.put(f"[실행 오류] {e}\n")
+        finally:
+            self.worker_mod = None
+            os.chdir(prev_cwd)
+        self.queue.put(f"\n=== 실행 종료 (rc={rc}) ===\n")
+        self.queue.put("__DONE__")
+
     # 리더 스레드
     def _reader_thread(self):
+        # 줄마다 읽고 디코딩하는 대신 os.read로 받은 만큼 한 번에 디코딩해 큐에 넣음
+        # - 청크 경계에서 잘린 한글 등 멀티바이트 문자는 증분 디코더가 이어 붙임 (cp949 이슈 방지)
+        # - 줄바꿈은 텍스트 모드와 같게 \r\n, \r → \n (청크 끝의 \r은 다음 청크와 합쳐서 판단)
         try:
             assert self.proc is not None
-            for line in self.proc.stdout:  # type: ignore[arg-type]
-                self.queue.put(line)
+            fd = self.proc.stdout.fileno()  # type: ignore[union-attr]
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            held_cr = False
+            while True:
+                buf = os.read(fd, 65536)
+                text = decoder.decode(buf, final=not buf)
+                if held_cr:
+                    text = "\r" + text
+                held_cr = bool(buf) and text.endswith("\r")
+                if held_cr:
+                    text = text[:-1]
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+                if text:
+                    self.queue.put(text)
+                if not buf:
+                    break
         except Exception as e:
             self.queue.put(f"[LOG 읽기 오류] {e}\n")
 
@@ -222,26 +309,45 @@ class RunnerApp(tk.Tk):
     def _waiter_thread(self):
         if not self.proc: return
         self.proc.wait()
+        if self.reader is not None:
+            self.reader.join()  # 남은 출력을 모두 큐에 넣은 뒤 종료 표시 (__DONE__ 이후로는 폴링하지 않음)
         self.queue.put(f"\n=== 프로세스 종료 (rc={self.proc.returncode}) ===\n")
         self.queue.put("__DONE__")
 
-    # 메인 루프 큐 폴링
+    # 메인 루프 큐 폴링 (실행 시작 시 켜고 __DONE__을 받으면 멈춤)
+    def _start_polling(self):
+        if not self._polling:
+            self._polling = True
+            self.after(50, self._poll_queue)
+
     def _poll_queue(self):
+        # 한 주기에 쌓인 출력은 모아서 한 번에 insert (줄마다 Text 갱신하지 않음)
+        chunks = []
+        done = False
         try:
             while True:
                 item = self.queue.get_nowait()
                 if item == "__DONE__":
-                    self._enable_controls(False); self.status.set("완료")
+                    done = True
                 else:
-                    self._append_log(item)
+                    chunks.append(item)
         except queue.Empty:
             pass
-        self.after(50, self._poll_queue)
+        if chunks:
+            self._append_log("".join(chunks))
+        if done:
+            self._enable_controls(False); self.status.set("완료")
+            self._polling = False
+        else:
+            self.after(50, self._poll_queue)
 
 # ─────────────────────────────────────────────────────────────
 # 엔트리포인트: --worker 모드 처리(동결 전용)
 # ─────────────────────────────────────────────────────────────
 def main():
+    # EXE에서 new_main이 프로세스 풀을 쓰면 자식 프로세스가 이 exe로 재실행됨 → 먼저 가로채기
+    multiprocessing.freeze_support()
+
     # EXE로 실행되었고 --worker가 붙었으면 워커로 동작
     if "--worker" in sys.argv:
         i = sys.argv.index("--worker")
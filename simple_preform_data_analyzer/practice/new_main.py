@@ -35,6 +35,7 @@ import argparse
 import os
 import re
 import sys
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -145,10 +146,13 @@ class Logger:
         self.cfg.log_dir.mkdir(exist_ok=True)
         self.log_path = self.cfg.log_dir / f"run_{datetime.now():%Y%m%d_%H%M%S}.txt"
         self._log_f = open(self.log_path, "w", encoding="utf-8", newline="")
-        sys.stdout = _Tee(sys.__stdout__, self._log_f)
-        sys.stderr = _Tee(sys.__stderr__, self._log_f)
+        # 현재 stdout/stderr에 덧붙여 기록 (app.py 인프로세스 실행 시 UI 출력 스트림 유지)
+        self._prev_streams = (sys.stdout, sys.stderr)
+        sys.stdout = _Tee(sys.stdout, self._log_f)
+        sys.stderr = _Tee(sys.stderr, self._log_f)
 
     def close(self):
+        sys.stdout, sys.stderr = self._prev_streams
         try:
             self._log_f.close()
         except Exception:
@@ -797,6 +801,10 @@ DEFAULT_ORDER = [
 ]
 
 
+# app.py(인프로세스 실행)의 중지 버튼 → 다음 단계 시작 전에 확인
+STOP_EVENT = threading.Event()
+
+
 def run_steps(step_keys: Iterable[str], cfg: Config) -> int:
     env = setup_utf8_console_and_env()
     logger = Logger(cfg)
@@ -813,6 +821,9 @@ def run_steps(step_keys: Iterable[str], cfg: Config) -> int:
     failed: List[Tuple[str, int]] = []
 
     for i, key in enumerate(step_keys, start=1):
+        if STOP_EVENT.is_set():
+            print("[중지] 사용자 요청으로 이후 단계를 실행하지 않습니다.")
+            break
         executed += 1
         title, fn = STEPS[key]
         tag = f"[{i}/{total}]"
@@ -6,7 +6,7 @@
 목적: 산재된 스크립트(resin/zero/group/final/type/analyzer)를 하나로 통합하여
      단일 파일에서 일괄 실행/부분 실행이 가능하도록 구성
 
-Python 3.9+ 권장. 의존성: pandas, openpyxl
+Python 3.9+ 권장. 의존성: pandas, openpyxl (선택: python-calamine — 모든 엑셀 읽기 가속(pandas 2.2+), xlsxwriter — 빠른 엑셀 저장, pyarrow — 리포트 parquet 사본/입력 캐시, xxhash — 빠른 캐시 키)
 
 사용 예시:
   1) 전체 실행:          python integrated_fiber_analyzer.py run-all
@@ -27,6 +27,9 @@ Python 3.9+ 권장. 의존성: pandas, openpyxl
   - 윈도우 콘솔 UTF-8, 화면+파일 동시 로깅 지원
   - 단계별 실패 시 STOP_ON_ERROR 설정에 따라 중단/계속
   - 열 인덱스는 0-based
+  - 리포트는 입력 내용이 지난번과 같으면 건너뜀 (<코드>_final_result_report.digest, --force 로 강제 재생성)
+  - --cache-dir 지정 시에만 ab/alls 파싱 결과를 parquet으로 캐시 (30일 미사용·1GiB 초과분은 자동 정리)
+  - --intermediate-format parquet: alls_cleaned/그룹별 파일을 .parquet으로 저장 (섞인 타입 열이 있으면 .xlsx 유지)
 
 추가(요청 반영):
   - group 단계에서 엑셀 저장 전, "3번째 열(0-based index 2)" 값이 같은 행은
@@ -43,12 +46,23 @@ Python 3.9+ 권장. 의존성: pandas, openpyxl
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
+import functools
+import hashlib
+import io
+import itertools
 import os
 import re
+import string
 import sys
+import threading
 import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime, time as dt_time
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -58,16 +72,47 @@ from typing import Dict, Iterable, List, Optional, Tuple
 try:  # 지연 임포트 대비, 즉시 실패 시 친절 메시지
     import pandas as pd
     import numpy as np
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
 except Exception as e:  # pragma: no cover
-    print("[오류] pandas 또는 numpy 임포트 실패.")
+    print("[오류] pandas, numpy 또는 openpyxl 임포트 실패.")
     print("       pip로 설치해 주세요:  pip install pandas openpyxl numpy")
     raise
 
-# openpyxl은 pandas가 내부에서 사용
+# openpyxl은 pandas가 내부에서도 사용
+try:  # (선택) python-calamine 설치 + pandas 2.2 이상이면 모든 엑셀 읽기를 calamine(Rust) 엔진으로
+    import python_calamine  # noqa: F401
+    _PD_VER = tuple(int(x) for x in pd.__version__.split(".")[:2])
+    READ_ENGINE = "calamine" if _PD_VER >= (2, 2) else "openpyxl"
+except ImportError:  # pragma: no cover
+    READ_ENGINE = "openpyxl"
+try:  # (선택) xlsxwriter 설치 시 constant_memory 스트리밍 저장, 없으면 openpyxl write_only
+    import xlsxwriter
+except ImportError:  # pragma: no cover
+    xlsxwriter = None
+try:  # (선택) pyarrow 설치 시 리포트 옆에 .parquet 사본 저장 → collect-total에서 빠르게 읽음
+    import pyarrow  # noqa: F401
+    HAS_PARQUET = True
+except ImportError:  # pragma: no cover
+    HAS_PARQUET = False
+try:  # (선택) xxhash 설치 시 캐시 키를 XXH3로 계산, 없으면 hashlib.blake2b
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None
 
 # ──────────────────────────────────────────────────────────────────────
 # 설정값
 # ──────────────────────────────────────────────────────────────────────
+# 입력 파싱 캐시 정리 기준: 마지막 사용 후 이 기간이 지났거나, 전체 크기가 상한을 넘으면 오래된 항목부터 삭제
+CACHE_MAX_AGE_DAYS = 30
+CACHE_MAX_BYTES = 1 << 30
+
+# 자동 병렬(--workers 미지정)에서 워커 프로세스 하나가 맡아야 할 최소 작업 수.
+# Windows(spawn)에서는 워커마다 pandas/numpy/openpyxl을 다시 임포트하므로 작업이 적으면 순차 처리가 더 빠름
+MIN_TASKS_PER_WORKER = 8
+
+
 @dataclass
 class Config:
     # 주요 파일/폴더 경로
@@ -87,6 +132,14 @@ class Config:
     use_w_pattern_first: bool = False  # 접두 추출 시 W-패턴 우선 여부
     filter_second_last_zero: bool = True  # C열의 뒤에서 2번째가 '0'인 행만 사용
     stop_on_error: bool = True
+    max_workers: Optional[int] = None  # 병렬 작업 수: 저장/리포트 프로세스, 파일 읽기 스레드 (None → 자동, 1 → 순차)
+
+    # 엑셀 입력(ab/alls) 파싱 캐시 폴더(내용 해시 기준, parquet). None(기본)이면 캐시 사용 안 함
+    cache_dir: Optional[Path] = None
+    force_rebuild: bool = False  # True면 입력 내용이 바뀌지 않은 리포트도 다시 생성
+
+    # 파이프라인 내부에서만 읽는 중간 산출물(alls_cleaned, 그룹별 파일) 형식: "xlsx" | "parquet"
+    intermediate_format: str = "xlsx"
 
     # 로깅
     log_dir: Path = Path("logs")
@@ -113,10 +166,10 @@ class _Tee:
         self.streams = streams
 
     def write(self, data):
+        # 쓰기마다 flush하지 않음 (콘솔은 줄 버퍼/PYTHONUNBUFFERED, 로그 파일은 단계 종료·종료 시 flush)
         for s in self.streams:
             try:
                 s.write(data)
-                s.flush()
             except Exception:
                 pass
 
@@ -156,10 +209,21 @@ class Logger:
         self.cfg.log_dir.mkdir(exist_ok=True)
         self.log_path = self.cfg.log_dir / f"run_{datetime.now():%Y%m%d_%H%M%S}.txt"
         self._log_f = open(self.log_path, "w", encoding="utf-8", newline="")
-        sys.stdout = _Tee(sys.__stdout__, self._log_f)
-        sys.stderr = _Tee(sys.__stderr__, self._log_f)
+        # 현재 stdout/stderr에 덧붙여 기록 (app.py 인프로세스 실행 시 UI 출력 스트림 유지)
+        self._prev_streams = (sys.stdout, sys.stderr)
+        sys.stdout = _Tee(sys.stdout, self._log_f)
+        sys.stderr = _Tee(sys.stderr, self._log_f)
+        atexit.register(self.flush)
+
+    def flush(self):
+        try:
+            self._log_f.flush()
+        except Exception:
+            pass
 
     def close(self):
+        atexit.unregister(self.flush)
+        sys.stdout, sys.stderr = self._prev_streams
         try:
             self._log_f.close()
         except Exception:
@@ -170,10 +234,48 @@ class Logger:
 # 공통 유틸 함수
 # ──────────────────────────────────────────────────────────────────────
 SAFE_NAME = re.compile(r"^[A-Za-z0-9_\-.]+$")
+UNSAFE_FILENAME_RUN = re.compile(r"[^A-Za-z0-9._-]+")
+_SAFE_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + "._-")
 W_PREFIX_REGEX = re.compile(r"^([A-Z0-9]{3}\d{5}[A-Z]\d{2}W\d{2}[^0-9])")
 GENERIC_RIGHTMOST_CHAR_BEFORE_DIGIT = re.compile(r"^(.+[A-Z])(?=\d)")
 FILENAME_TO_PREFORM = re.compile(r"^([A-Z0-9]{3}\d{5}).*?([A-Z])$")
-ZERO_LIKE = re.compile(r'^[\+\-]?\s*0+(?:[.,]0+)?\s*$')
+# '0' 변형: "0", "-0,00", "+ 0" 및 숫자로 읽히는 0(" .0", "0.", "0e5" 등)까지 한 정규식으로 판정
+ZERO_LIKE = re.compile(r'^(?:[\+\-]?\s*0+(?:[.,]0+)?|\s*[\+\-]?(?:0+(?:[.,]0*)?|[.,]0+)(?:[eE][\+\-]?\d+)?)\s*$')
+
+
+def _re2_char_class(pred) -> str:
+    # pred를 만족하는 유니코드 문자 전체를 RE2 문자 클래스로 ([\x{9}-\x{d}\x{20}...])
+    parts, start, prev = [], None, None
+    for cp in range(sys.maxunicode + 1):
+        if pred(chr(cp)):
+            if start is None:
+                start = cp
+            prev = cp
+        elif start is not None:
+            parts.append(f"\\x{{{start:x}}}" if start == prev else f"\\x{{{start:x}}}-\\x{{{prev:x}}}")
+            start = None
+    return "[" + "".join(parts) + "]"
+
+
+@functools.lru_cache(maxsize=None)
+def _re2_zero_like() -> str:
+    # RE2(pyarrow)의 \s, \d는 ASCII만 → 파이썬 re와 같은 유니코드 공백/숫자 클래스로 풀어 씀
+    return (ZERO_LIKE.pattern
+            .replace(r"\s", _re2_char_class(str.isspace))
+            .replace(r"\d", _re2_char_class(str.isdecimal)))
+
+
+def zero_like_mask(txt: pd.Series) -> pd.Series:
+    """문자열 Series가 ZERO_LIKE에 전체 일치하는지 (bool Series).
+
+    pyarrow가 있으면 Arrow 문자열로 바꿔 RE2로 한 번에 판정하고, 변환/정규식이 실패하면 re로 판정한다.
+    """
+    if HAS_PARQUET:
+        try:
+            return txt.astype("string[pyarrow]").str.fullmatch(_re2_zero_like()).astype(bool)
+        except Exception:
+            pass
+    return txt.str.match(ZERO_LIKE)
 
 
 def normalize_str(x) -> Optional[str]:
@@ -183,6 +285,13 @@ def normalize_str(x) -> Optional[str]:
     return s if s else None
 
 
+def normalize_str_series(col: pd.Series) -> pd.Series:
+    # normalize_str의 열 단위 버전 (행마다 파이썬 함수 호출 없이 처리, 결측/공백 → None)
+    # astype(object)를 거쳐 날짜 열도 str(x)와 같은 문자열이 되도록 함
+    s = col.astype(object).astype(str).str.strip()
+    return s.where(col.notna() & (s != ""), None)
+
+
 def second_last_is_zero(val) -> bool:
     if pd.isna(val):
         return False
@@ -190,17 +299,23 @@ def second_last_is_zero(val) -> bool:
     return len(s) >= 2 and s[-2] == "0"
 
 
+def second_last_zero_mask(col: pd.Series) -> pd.Series:
+    # second_last_is_zero의 열 단위 버전 (행마다 파이썬 함수 호출 없이 str 접근자로 처리)
+    s = col.astype(str).str.strip()
+    return col.notna() & (s.str.len() >= 2) & (s.str[-2] == "0")
+
+
 def safe_filename(name: str) -> str:
     s = str(name).strip() or "EMPTY"
-    return re.sub(r"[^A-Za-z0-9._-]+", "_", s)
+    if _SAFE_FILENAME_CHARS.issuperset(s):  # 대부분의 그룹 키는 이미 안전 → 정규식 치환 생략
+        return s
+    return UNSAFE_FILENAME_RUN.sub("_", s)
 
 
-def make_avg_row(df: pd.DataFrame) -> Dict[str, object]:
-    avg = {}
-    for col in df.columns:
-        s_num = pd.to_numeric(df[col], errors="coerce")
-        avg[col] = s_num.mean() if s_num.notna().any() else ""
-    return avg
+def make_avg_row(num: pd.DataFrame) -> List[object]:
+    # 숫자로 변환해 둔 그룹 표의 열 평균을 한 번에 계산 (숫자가 하나도 없는 열은 빈칸), 열 순서대로 반환
+    means = num.mean()
+    return [m if pd.notna(m) else "" for m in means.to_numpy()]
 
 
 def extract_prefix_generic(s: str) -> str:
@@ -230,6 +345,23 @@ def extract_group_prefix(s: str, use_w_first: bool) -> str:
         return p if p else extract_prefix_wpattern(s)
 
 
+def extract_group_prefix_series(col: pd.Series, use_w_first: bool) -> pd.Series:
+    # extract_group_prefix의 열 단위 버전. 두 정규식 모두 ^로 시작하므로 str.extract 결과가 동일
+    raw = col.astype(str)
+    t = raw.str.strip().str.upper()
+    t[col.isna() & (raw == "None")] = ""  # None은 빈 키 (NaN은 기존처럼 "NAN")
+    if not use_w_first:
+        # 일반 규칙은 매칭 실패 시 t 자체를 쓰므로 t가 빈 문자열일 때만 비고, 그때 W-패턴도 빈 문자열
+        # → W-패턴 정규식은 돌릴 필요 없음
+        return t.str.extract(GENERIC_RIGHTMOST_CHAR_BEFORE_DIGIT, expand=False).fillna(t)
+    wpattern = t.str.extract(W_PREFIX_REGEX, expand=False).fillna("")
+    miss = wpattern == ""
+    if miss.any():  # W-패턴에 안 맞는 행만 일반 규칙 적용
+        tm = t[miss]
+        wpattern[miss] = tm.str.extract(GENERIC_RIGHTMOST_CHAR_BEFORE_DIGIT, expand=False).fillna(tm)
+    return wpattern
+
+
 def is_empty(val) -> bool:
     if val is None:
         return True
@@ -242,11 +374,21 @@ def is_empty(val) -> bool:
 
 
 def candidate_files(prefix_dir: Path) -> List[Path]:
-    out_file = prefix_dir / f"{prefix_dir.name}.xlsx"
-    return sorted(
-        p for p in prefix_dir.glob("*.xlsx")
-        if p.name.lower() != out_file.name.lower() and not p.name.startswith("~$")
-    )
+    # 폴더를 os.scandir로 한 번만 훑어 .xlsx / .parquet 그룹 파일을 함께 고름 (glob 두 번 대신)
+    # 확장자 비교는 normcase로 glob과 같게 (Windows는 대소문자 무시)
+    out_name = f"{prefix_dir.name}.xlsx".lower()
+    found: List[Path] = []
+    with os.scandir(prefix_dir) as it:
+        for e in it:
+            name = e.name
+            stem, ext = os.path.splitext(os.path.normcase(name))
+            if ext == ".xlsx":
+                if name.lower() != out_name and not name.startswith("~$"):
+                    found.append(Path(e.path))
+            elif ext == ".parquet" and not stem.endswith("_final_result_report"):
+                # parquet 형식 그룹 파일 (리포트의 .parquet 사본은 제외)
+                found.append(Path(e.path))
+    return sorted(found)
 
 
 def preform_from_filename(path: Path, fallback: Optional[str] = None) -> Optional[str]:
@@ -260,15 +402,315 @@ def preform_from_filename(path: Path, fallback: Optional[str] = None) -> Optiona
 
 def _normalize_as_text(s: pd.Series) -> pd.Series:
     out = s.astype("string").fillna("")
-    out = out.str.replace(r"\.0$", "", regex=True)
+    out = out.str.removesuffix(".0")  # 정규식 없이 끝의 ".0"만 제거
     return out.astype("object")
 
 
+def read_sheet_raw(path: Path) -> pd.DataFrame:
+    """첫 시트를 header=None 형태로 읽는다 (calamine 우선, 없으면 openpyxl read_only)."""
+    if READ_ENGINE == "calamine":
+        return pd.read_excel(path, header=None, engine=READ_ENGINE)
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = list(wb.active.iter_rows(values_only=True))
+    finally:
+        wb.close()
+    while rows and all(v is None for v in rows[-1]):
+        rows.pop()
+    return pd.DataFrame(rows)
+
+
+def _xlsx_value(v):
+    # 셀 값 정규화: NaN/NaT/NA → 빈칸, numpy 스칼라 → 파이썬 값, inf → 문자열(pandas inf_rep와 동일)
+    if v is None or v is pd.NA or v is pd.NaT:
+        return None
+    if isinstance(v, np.generic):
+        v = v.item()
+    if isinstance(v, float):
+        if v != v:
+            return None
+        if v in (float("inf"), float("-inf")):
+            return "inf" if v > 0 else "-inf"
+    if isinstance(v, pd.Timestamp):
+        return v.to_pydatetime()
+    return v
+
+
+def write_rows_xlsx(path: Path, rows: Iterable[Iterable[object]], sheet_name: str = "Sheet1") -> None:
+    """행 단위 스트리밍 저장 (xlsxwriter constant_memory, 미설치 시 openpyxl write_only)."""
+    if xlsxwriter is not None:
+        wb = xlsxwriter.Workbook(str(path), {
+            "constant_memory": True,
+            "default_date_format": "yyyy-mm-dd hh:mm:ss",
+        })
+        try:
+            ws = wb.add_worksheet(sheet_name)
+            for r, row in enumerate(rows):
+                ws.write_row(r, 0, [_xlsx_value(v) for v in row])
+        finally:
+            wb.close()
+        return
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    for row in rows:
+        ws.append([_xlsx_value(v) for v in row])
+    wb.save(path)
+
+
+def write_df_xlsx(df: pd.DataFrame, path: Path, sheet_name: str = "Sheet1") -> None:
+    """df.to_excel(index=False) 대체: 제목 행 + 데이터 행을 write_rows_xlsx로 스트리밍 저장."""
+    header = [None if isinstance(c, float) and c != c else c for c in df.columns]
+    write_rows_xlsx(path, itertools.chain([header], df.itertuples(index=False, name=None)), sheet_name)
+
+
+def write_df_xlsx_marked(df: pd.DataFrame, path: Path, red: np.ndarray, sheet_name: str = "Sheet1") -> None:
+    """write_df_xlsx + red(df와 같은 모양의 bool 배열)가 True인 셀은 빨간 글자 (xlsxwriter, 없으면 openpyxl write_only)."""
+    marked_rows = set(np.flatnonzero(red.any(axis=1)).tolist())
+    if xlsxwriter is None:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+        red_font = Font(color="FF0000")
+        ws.append([_xlsx_value(c) for c in df.columns])
+        for r, row in enumerate(df.itertuples(index=False, name=None)):
+            values = [_xlsx_value(v) for v in row]
+            if r in marked_rows:  # 표시할 셀만 서식 있는 셀 객체로 교체
+                for c in np.flatnonzero(red[r]):
+                    cell = WriteOnlyCell(ws, value=values[c])
+                    cell.font = red_font
+                    values[c] = cell
+            ws.append(values)
+        wb.save(path)
+        return
+
+    wb = xlsxwriter.Workbook(str(path), {
+        "constant_memory": True,
+        "default_date_format": "yyyy-mm-dd hh:mm:ss",
+    })
+    try:
+        ws = wb.add_worksheet(sheet_name)
+        red_fmt = wb.add_format({"font_color": "#FF0000"})
+        ws.write_row(0, 0, [_xlsx_value(c) for c in df.columns])
+        for r, row in enumerate(df.itertuples(index=False, name=None)):
+            values = [_xlsx_value(v) for v in row]
+            ws.write_row(r + 1, 0, values)
+            if r in marked_rows:  # constant_memory: 같은 행 안에서는 셀을 다시 쓸 수 있음
+                for c in np.flatnonzero(red[r]):
+                    ws.write(r + 1, int(c), values[c], red_fmt)
+    finally:
+        wb.close()
+
+
+def write_intermediate(df: pd.DataFrame, path: Path, fmt: str = "xlsx") -> Path:
+    """중간 산출물 저장. fmt="parquet"이면 .parquet으로, 불가하면(pyarrow 없음/섞인 타입 열 등) .xlsx로 저장.
+
+    저장한 형식과 다른 쪽의 이전 파일은 지워서 읽는 쪽이 오래된 파일을 집지 않게 한다.
+    """
+    xlsx_path, pq_path = path.with_suffix(".xlsx"), path.with_suffix(".parquet")
+    if fmt == "parquet" and HAS_PARQUET:
+        try:
+            df.to_parquet(pq_path, index=False)
+            xlsx_path.unlink(missing_ok=True)
+            return pq_path
+        except Exception:
+            pq_path.unlink(missing_ok=True)
+    write_df_xlsx(df, xlsx_path)
+    pq_path.unlink(missing_ok=True)
+    return xlsx_path
+
+
+def find_intermediate(path: Path) -> Optional[Path]:
+    # .parquet이 있으면 우선, 없으면 .xlsx
+    for p in (path.with_suffix(".parquet"), path.with_suffix(".xlsx")):
+        if p.exists():
+            return p
+    return None
+
+
+def read_intermediate(path: Path) -> pd.DataFrame:
+    if path.suffix.lower() == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_excel(path, engine=READ_ENGINE)
+
+
+def _new_hasher():
+    # 캐시 키/변경 감지 용도라 암호학적 해시는 불필요. 알고리즘 이름을 앞에 붙여 키가 섞이지 않게 함
+    if xxhash is not None:
+        return xxhash.xxh3_128(), "xxh3"
+    return hashlib.blake2b(digest_size=16), "b2"
+
+
+def _xlsx_content_digest(path: Path) -> str:
+    # 엑셀은 같은 내용을 다시 저장해도 문서 속성(docProps/core.xml의 작성 시각)이 바뀌므로 그 부분만 빼고 해시
+    # (zip이 아니면 파일 전체 해시)
+    try:
+        zf = zipfile.ZipFile(path)
+    except zipfile.BadZipFile:
+        return _file_digest(path)
+    h, tag = _new_hasher()
+    with zf:
+        for name in sorted(zf.namelist()):
+            if name == "docProps/core.xml":
+                continue
+            h.update(name.encode("utf-8"))
+            h.update(zf.read(name))
+    return f"{tag}x-{h.hexdigest()}"
+
+
+def _file_digest(path: Path) -> str:
+    h, tag = _new_hasher()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return f"{tag}-{h.hexdigest()}"
+
+
+def prune_cache(cache_dir: Path, max_age_days: int = CACHE_MAX_AGE_DAYS, max_bytes: int = CACHE_MAX_BYTES) -> None:
+    # 마지막 사용(mtime) 기준으로 오래된 항목부터 삭제: 기간이 지난 항목 전부 + 크기 상한을 넘는 만큼
+    # 이전 버전이 남긴 .pkl 항목도 같은 기준으로 정리. 쓰는 중인 .tmp는 기간이 지난 것만 삭제
+    cutoff = time.time() - max_age_days * 86400
+    entries: List[Tuple[float, int, str]] = []
+    with os.scandir(cache_dir) as it:
+        for e in it:
+            if not e.is_file() or not e.name.endswith((".parquet", ".pkl", ".tmp")):
+                continue
+            st = e.stat()
+            if e.name.endswith(".tmp") and st.st_mtime >= cutoff:
+                continue
+            entries.append((st.st_mtime, st.st_size, e.path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for mtime, size, p in entries:
+        if mtime >= cutoff and total <= max_bytes:
+            break
+        try:
+            os.remove(p)
+            total -= size
+        except OSError:
+            pass
+
+
+# 캐시 parquet의 object 열은 셀마다 "타입 한 글자 + 문자열"로 저장 (문자열/숫자가 섞인 열도 타입 그대로 왕복)
+_CACHE_CELL_ENCODERS = {
+    str: lambda v: "s" + v,
+    int: lambda v: "i" + str(v),
+    float: lambda v: "f" + repr(v),
+    bool: lambda v: "b1" if v else "b0",
+    datetime: lambda v: "d" + v.isoformat(),
+    pd.Timestamp: lambda v: "T" + v.isoformat(),
+    date: lambda v: "D" + v.isoformat(),
+    dt_time: lambda v: "t" + v.isoformat(),
+}
+_CACHE_CELL_DECODERS = {
+    "s": str,
+    "i": int,
+    "f": float,
+    "b": lambda x: x == "1",
+    "d": datetime.fromisoformat,
+    "T": pd.Timestamp,
+    "D": date.fromisoformat,
+    "t": dt_time.fromisoformat,
+}
+_CACHE_FORMAT = "v2"  # 저장 형식이 바뀌면 올려서 이전 항목을 쓰지 않게 함 (이전 항목은 prune_cache가 정리)
+
+
+def _encode_cache_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # object 열만 태그 문자열로 바꾼 복사본. 모르는 타입(NaT, numpy 스칼라 등)이 있으면 KeyError → 캐시 생략
+    out = df.copy(deep=False)
+    enc = _CACHE_CELL_ENCODERS
+    for i in np.flatnonzero((df.dtypes == object).to_numpy()):
+        col = df.iloc[:, i]
+        out.isetitem(i, pd.Series([None if v is None else enc[type(v)](v) for v in col],
+                                  index=col.index, dtype=object))
+    return out
+
+
+def _decode_cache_frame(df: pd.DataFrame) -> pd.DataFrame:
+    dec = _CACHE_CELL_DECODERS
+    for i in np.flatnonzero((df.dtypes == object).to_numpy()):
+        col = df.iloc[:, i]
+        df.isetitem(i, pd.Series([None if v is None else dec[v[0]](v[1:]) for v in col],
+                                 index=col.index, dtype=object))
+    return df
+
+
+def _read_cache_frame(cache_path: Path, header: Optional[int]) -> pd.DataFrame:
+    df = _decode_cache_frame(pd.read_parquet(cache_path))
+    if header is None:
+        df.columns = pd.RangeIndex(df.shape[1])
+    return df
+
+
+def load_sheet_cached(path: Path, cache_dir: Optional[Path], header: Optional[int] = None) -> pd.DataFrame:
+    """첫 시트 읽기 + 파일 내용 해시 기반 parquet 캐시 (내용이 같으면 엑셀 파싱 생략).
+
+    header=None이면 read_sheet_raw, 정수면 pd.read_excel(header=...)로 읽는다.
+    캐시는 cache_dir을 지정했고 pyarrow가 있을 때만 쓴다. object 열은 셀 타입을 붙인 문자열로 저장해
+    문자열/숫자가 섞여 있어도 그대로 되돌리고, 저장 직후 다시 읽어 원본과 같을 때만 캐시로 남긴다.
+    """
+    def read() -> pd.DataFrame:
+        if header is None:
+            return read_sheet_raw(path)
+        return pd.read_excel(path, header=header, engine=READ_ENGINE)
+
+    if cache_dir is None or not HAS_PARQUET:
+        return read()
+
+    suffix = "" if header is None else f".h{header}"  # 읽는 방식이 다르면 다른 캐시 항목
+    cache_path = cache_dir / f"{_file_digest(path)}{suffix}.{_CACHE_FORMAT}.parquet"
+    if cache_path.exists():
+        try:
+            df = _read_cache_frame(cache_path, header)
+            os.utime(cache_path)  # 마지막 사용 시각 갱신 (정리 기준)
+            return df
+        except Exception:
+            pass  # 손상된 캐시는 무시하고 다시 읽음
+
+    df = read()
+    if header is not None and not (df.columns.is_unique and all(isinstance(c, str) for c in df.columns)):
+        return df  # parquet 열 이름으로 그대로 되돌릴 수 없는 제목 행
+
+    tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+    try:
+        stored = _encode_cache_frame(df)
+        if header is None:
+            stored.columns = [str(c) for c in stored.columns]  # 읽을 때 RangeIndex로 되돌림
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        stored.to_parquet(tmp_path, index=False)
+        if not _read_cache_frame(tmp_path, header).equals(df):
+            tmp_path.unlink(missing_ok=True)  # 되돌린 표가 원본과 다르면 캐시하지 않음
+            return df
+        os.replace(tmp_path, cache_path)  # 병렬 워커끼리 겹쳐도 안전하게 교체
+    except Exception:
+        tmp_path.unlink(missing_ok=True)  # 저장할 수 없는 값(모르는 셀 타입 등)이 있는 표
+        return df
+    prune_cache(cache_dir)
+    return df
+
+
 def _is_temp_or_hidden(p: Path) -> bool:
     name = p.name
     return name.startswith("~$") or name.startswith(".") or name.endswith(".tmp")
 
 
+def resolve_workers(cfg: Config, n_tasks: int) -> int:
+    # 프로세스 풀 크기. --workers를 주면 그 값(작업 수 이하), 자동이면 워커 하나가 작업을
+    # MIN_TASKS_PER_WORKER개 이상 맡을 때만 병렬 (1이면 호출하는 쪽이 같은 프로세스에서 순차 처리)
+    if cfg.max_workers:
+        return max(1, min(cfg.max_workers, n_tasks))
+    return max(1, min(os.cpu_count() or 1, n_tasks // MIN_TASKS_PER_WORKER))
+
+
+def scan_subdirs(root: Path) -> List[Path]:
+    # os.scandir 한 번으로 하위 폴더 나열 (DirEntry.is_dir은 추가 stat 없이 디렉터리 항목 정보 사용)
+    with os.scandir(root) as it:
+        return [
+            Path(e.path) for e in it
+            if not e.name.startswith(("~$", ".")) and e.is_dir()
+        ]
+
+
 def pick_input_file(subfolder: Path) -> Optional[Path]:
     c1 = subfolder / f"{subfolder.name}.xlsx"
     c2 = subfolder / "final.xlsx"
@@ -288,7 +730,7 @@ def step_resin_analyze_and_group_ab(cfg: Config) -> int:
         print(f"[resin][오류] 엑셀 파일 없음: {cfg.excel_ab.resolve()}")
         return 1
 
-    df = pd.read_excel(cfg.excel_ab, engine="openpyxl")
+    df = load_sheet_cached(cfg.excel_ab, cfg.cache_dir, header=0)
 
     # (1) 레진 집계
     if cfg.resin_col_idx >= df.shape[1]:
@@ -296,7 +738,7 @@ def step_resin_analyze_and_group_ab(cfg: Config) -> int:
         return 1
 
     resin_series = (
-        df.iloc[:, cfg.resin_col_idx].map(normalize_str).dropna().map(lambda s: s.upper())
+        normalize_str_series(df.iloc[:, cfg.resin_col_idx]).dropna().str.upper()
     )
 
     if len(resin_series) == 0:
@@ -313,31 +755,31 @@ def step_resin_analyze_and_group_ab(cfg: Config) -> int:
         print(f"[resin][오류] 1번째 열(인덱스 {cfg.drawno_col_idx}) 없음. 실제 열 수: {df.shape[1]}")
         return 1
 
-    draw_series = df.iloc[:, cfg.drawno_col_idx].map(normalize_str).dropna()
+    draw_series = normalize_str_series(df.iloc[:, cfg.drawno_col_idx]).dropna().astype(str)
 
-    prefix_map: Dict[str, set] = {}
-    for val in draw_series:
-        if len(val) < 3:
-            continue
-        if not SAFE_NAME.match(val):
-            continue
-        prefix = val[:3]
-        if not SAFE_NAME.match(prefix):
-            continue
-        prefix_map.setdefault(prefix, set()).add(val)
+    # 길이 3 이상 + 안전한 이름만 남기고 앞 3글자로 묶기 (안전한 이름의 앞 3글자도 항상 안전)
+    valid = draw_series[(draw_series.str.len() >= 3) & draw_series.str.match(SAFE_NAME)]
+    # 접두어별 draw_no 개수는 중복 제거 후 value_counts 한 번으로 (접두어마다 set을 만들지 않음)
+    uniq = valid.drop_duplicates()
+    prefixes = uniq.str[:3]
+    drawno_counts = prefixes.value_counts().sort_index()
 
+    # 이미 있는 폴더는 scan_subdirs 한 번으로 확인하고 없는 폴더만 생성 (재실행 시 mkdir 시도 생략)
     cfg.out_grouped_by_prefix.mkdir(parents=True, exist_ok=True)
-    for prefix, fullset in prefix_map.items():
+    existing_prefixes = {p.name for p in scan_subdirs(cfg.out_grouped_by_prefix)}
+    for prefix, names in uniq.groupby(prefixes):
         prefix_dir = cfg.out_grouped_by_prefix / prefix
-        prefix_dir.mkdir(exist_ok=True)
-        for full in sorted(fullset):
+        if prefix in existing_prefixes:
+            names = names[~names.isin({p.name for p in scan_subdirs(prefix_dir)})]
+        else:
+            prefix_dir.mkdir(exist_ok=True)
+        for full in sorted(names):
             (prefix_dir / full).mkdir(exist_ok=True)
 
-    if prefix_map:
-        prefix_list = ",".join(sorted(prefix_map.keys()))
+    if len(drawno_counts):
+        prefix_list = ",".join(drawno_counts.index)
         print(f"[resin] 조회된 접두어: {prefix_list}")
-        for prefix in sorted(prefix_map.keys()):
-            cnt = len(prefix_map[prefix])
+        for prefix, cnt in drawno_counts.items():
             print(f"[resin] {prefix}: draw_no {cnt}개")
     else:
         print("[resin] 접두어 기반 폴더 생성 대상 없음")
@@ -346,14 +788,10 @@ def step_resin_analyze_and_group_ab(cfg: Config) -> int:
     try:
         if len(resin_series) > 0:
             resin_counts.to_frame("count").to_csv(cfg.excel_ab.with_name("resin_type_counts.csv"))
-        if prefix_map:
-            import csv
-            out_csv = cfg.excel_ab.with_name("prefix_drawno_counts.csv")
-            with out_csv.open("w", newline="", encoding="utf-8") as f:
-                w = csv.writer(f)
-                w.writerow(["prefix", "draw_no_count"])
-                for p in sorted(prefix_map.keys()):
-                    w.writerow([p, len(prefix_map[p])])
+        if len(drawno_counts):
+            drawno_counts.rename_axis("prefix").to_frame("draw_no_count").to_csv(
+                cfg.excel_ab.with_name("prefix_drawno_counts.csv")
+            )
     except Exception as e:
         print(f"[resin](경고) 요약 CSV 저장 실패: {e}")
 
@@ -366,38 +804,63 @@ def step_zero_to_blank_all(cfg: Config) -> int:
         print(f"[zero][오류] 엑셀 파일 없음: {cfg.excel_alls.resolve()}")
         return 1
 
-    df = pd.read_excel(cfg.excel_alls, engine="openpyxl")
+    df = load_sheet_cached(cfg.excel_alls, cfg.cache_dir, header=0)
 
     # 숫자형 0 → None (bool 제외)
     num_cols = df.select_dtypes(include=[np.number]).columns
     bool_cols = df.select_dtypes(include=["bool"]).columns
     num_cols = [c for c in num_cols if c not in bool_cols]
 
-    for c in num_cols:
-        df[c] = df[c].mask(df[c] == 0, other=None)
+    # 숫자 열 전체를 한 번에 마스킹 (0 → NaN, 열마다 숫자 dtype 유지 · object로 바꾸지 않음)
+    if num_cols:
+        num = df[num_cols]
+        df[num_cols] = num.mask(num == 0)
 
     # 비숫자형에서 '0' 변형들 → None
     obj_cols = df.columns.difference(num_cols).tolist()
     for c in obj_cols:
         s = df[c]
-        s_str = s.astype(str)
-        mask = s_str.str.match(ZERO_LIKE, na=False)
-        num_eq_zero = pd.to_numeric(s_str.str.replace(",", ".", regex=False), errors="coerce").eq(0)
-        final_mask = (mask | num_eq_zero) & s.notna()
-        df.loc[final_mask, c] = None
-
-    df.to_excel(cfg.excel_alls_cleaned, index=False, engine="openpyxl")
-    print(f"[zero] 완료 → {cfg.excel_alls_cleaned.resolve()}")
+        # 빈 셀은 문자열 변환/정규식 검사에서 빼고, 바꿀 셀이 있을 때만 대입
+        nn = s.notna()
+        if not nn.any():
+            continue
+        hit = zero_like_mask(s[nn].astype(str))
+        if hit.any():
+            df.loc[hit[hit].index, c] = None
+
+    saved = write_intermediate(df, cfg.excel_alls_cleaned, cfg.intermediate_format)
+    print(f"[zero] 완료 → {saved.resolve()}")
     return 0
 
 
+def _write_group_book(g_out: pd.DataFrame, avg_row: List[object], out_path: Path, fmt: str = "xlsx") -> Optional[str]:
+    # 그룹 파일 하나 저장 (프로세스 풀 워커에서 실행). 실패 시 출력할 메시지 반환
+    try:
+        if fmt == "parquet" and HAS_PARQUET:
+            # parquet은 표 단위 저장이라 평균행을 붙인 DataFrame이 필요
+            with_avg = pd.concat([g_out, pd.DataFrame([avg_row], columns=g_out.columns)], ignore_index=True)
+            write_intermediate(with_avg, out_path, fmt)
+        else:
+            # xlsx는 제목 행 → 데이터 행 → 평균행 순으로 바로 스트리밍 (copy/concat 없음)
+            header = [None if isinstance(c, float) and c != c else c for c in g_out.columns]
+            write_rows_xlsx(
+                out_path.with_suffix(".xlsx"),
+                itertools.chain([header], g_out.itertuples(index=False, name=None), [avg_row]),
+            )
+            out_path.with_suffix(".parquet").unlink(missing_ok=True)
+    except Exception as e:
+        return f"[group][오류] 저장 실패: {out_path.name} → {e}"
+    return None
+
+
 def step_group_by_col4_with_prefix_and_avg(cfg: Config) -> int:
     print("[group] 3/4열 기반 그룹 저장 + 평균행 추가 (중복 제거 후)")
-    if not cfg.excel_alls_cleaned.exists():
+    cleaned = find_intermediate(cfg.excel_alls_cleaned)
+    if cleaned is None:
         print(f"[group][오류] 파일 없음: {cfg.excel_alls_cleaned.resolve()}")
         return 1
 
-    df = pd.read_excel(cfg.excel_alls_cleaned, engine="openpyxl")
+    df = read_intermediate(cleaned)
 
     need_max = max(cfg.col3_idx, cfg.col4_idx)
     if df.shape[1] <= need_max:
@@ -407,31 +870,47 @@ def step_group_by_col4_with_prefix_and_avg(cfg: Config) -> int:
     col3 = df.columns[cfg.col3_idx]
     col4 = df.columns[cfg.col4_idx]
 
-    # (A) C열 필터 (옵션)
-    filtered = df.copy()
+    # (A) C열 필터(옵션) + (B) D열 공백 제거: 마스크 하나로 합쳐 원본 전체를 복사하지 않음
+    keep = df[col4].notna() & (df[col4].astype(str).str.strip() != "")
     if cfg.filter_second_last_zero:
-        mask = filtered[col3].map(second_last_is_zero)
-        filtered = filtered[mask].copy()
-
-    # (B) D열 공백 제거
-    filtered = filtered[filtered[col4].notna() & (filtered[col4].astype(str).str.strip() != "")]
-    if filtered.empty:
+        keep &= second_last_zero_mask(df[col3])
+    if not keep.any():
         print("[group] 필터 후 데이터가 없습니다.")
         return 0
 
-    # (C) 그룹 키 추출
-    filtered["_group_key_"] = filtered[col3].apply(lambda s: extract_group_prefix(s, cfg.use_w_pattern_first))
-    filtered = filtered[filtered["_group_key_"].astype(str).str.strip() != ""]
-    if filtered.empty:
+    # (C) 그룹 키 추출 (남은 행만), 키가 있는 행만 한 번에 잘라냄
+    keys = extract_group_prefix_series(df.loc[keep, col3], cfg.use_w_pattern_first)
+    keys = keys[keys.astype(str).str.strip() != ""]
+    if keys.empty:
         print("[group] 유효한 그룹 키가 없습니다.")
         return 0
+    data_cols = df.columns
+    filtered = df.loc[keys.index].assign(_group_key_=keys)
+    del df, keep  # 원본은 더 이상 쓰지 않으므로 바로 해제
 
     cfg.out_grouped_by_col4.mkdir(parents=True, exist_ok=True)
 
-    from collections import defaultdict
-    prefix_counts: Dict[str, int] = defaultdict(int)
+    # 🔹 (추가) 평균 계산 전에 "3번째 열(인덱스 2)" 기준 중복 제거 — 전체 그룹을 한 번에 처리
+    if len(data_cols) >= 3:
+        dedup_col = data_cols[2]  # 0-based: 2 -> 3번째 열
+        filtered["_dedup_key_"] = normalize_str_series(filtered[dedup_col])
+        dedup = filtered.drop_duplicates(subset=["_group_key_", "_dedup_key_"], keep="first")
+        removed_by_key = (
+            filtered.groupby("_group_key_").size()
+            .sub(dedup.groupby("_group_key_").size(), fill_value=0)
+        )
+    else:
+        dedup_col = None
+        dedup = filtered
+        removed_by_key = pd.Series(dtype=int)
+
+    # 🔹 평균행용 숫자 변환은 전체 그룹에 대해 한 번만 수행
+    # (groupby().mean()은 보정 합산이라 기존 평균과 끝자리가 달라져 4자리 반올림 결과가 바뀜 → 그룹별 mean 유지)
+    num_all = dedup[data_cols].apply(pd.to_numeric, errors="coerce")
+
+    jobs: List[Tuple[str, pd.DataFrame, List[object], Path]] = []
 
-    for key, g in filtered.groupby("_group_key_", dropna=False):
+    for key, g in dedup.groupby("_group_key_", dropna=False):
         key_str = str(key).strip()
         if not key_str:
             continue
@@ -441,44 +920,75 @@ def step_group_by_col4_with_prefix_and_avg(cfg: Config) -> int:
         dest_dir.mkdir(parents=True, exist_ok=True)
 
         # === 저장 대상 테이블 구성 ===
-        g_out = g.drop(columns=["_group_key_"]).copy()
-
-        # 🔹 (추가) 평균 계산 전에 "3번째 열(인덱스 2)" 기준 중복 제거
-        if g_out.shape[1] >= 3:
-            dedup_col = g_out.columns[2]  # 0-based: 2 -> 3번째 열
-            before_n = len(g_out)
-            g_out["_dedup_key_"] = g_out[dedup_col].map(normalize_str)
-            g_out = (
-                g_out
-                .drop_duplicates(subset=["_dedup_key_"], keep="first")
-                .drop(columns=["_dedup_key_"])
-                .reset_index(drop=True)
-            )
-            removed = before_n - len(g_out)
+        g_out = g[data_cols]
+        if dedup_col is not None:
+            removed = int(removed_by_key.get(key, 0))
             if removed > 0:
                 print(f"[group][중복제거] {key_str}: 3번째 열 '{dedup_col}' 기준 {removed}행 제거")
         else:
             print(f"[group][정보] {key_str}: 열 수가 3 미만이라 중복 제거 스킵")
 
-        # 🔹 평균행 계산 및 부착
-        avg_row = make_avg_row(g_out)
-        g_out = pd.concat([g_out, pd.DataFrame([avg_row])], ignore_index=True)
+        # 🔹 평균행 (data_cols 순서의 값 목록, 저장 시 마지막 행으로 붙음)
+        avg_row = make_avg_row(num_all.loc[g.index])
 
         out_path = dest_dir / f"{safe_filename(key_str)}.xlsx"
-        try:
-            g_out.to_excel(out_path, index=False, engine="openpyxl")
-        except Exception as e:
-            print(f"[group][오류] 저장 실패: {out_path.name} → {e}")
-            continue
+        jobs.append((prefix3, g_out, avg_row, out_path))
+
+    # 그룹 파일끼리는 독립적 → 저장(XML 직렬화+압축)을 프로세스 풀로 분산
+    workers = resolve_workers(cfg, len(jobs))
+    tables = [g_out for _, g_out, _, _ in jobs]
+    avg_rows = [avg_row for _, _, avg_row, _ in jobs]
+    paths = [out_path for _, _, _, out_path in jobs]
+    write_book = functools.partial(_write_group_book, fmt=cfg.intermediate_format)
+    if workers <= 1:
+        errors = list(map(write_book, tables, avg_rows, paths))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            chunk = max(1, len(jobs) // (workers * 4))
+            errors = list(ex.map(write_book, tables, avg_rows, paths, chunksize=chunk))
 
-        prefix_counts[prefix3] += 1
+    for err in filter(None, errors):
+        print(err)
 
-    for pfx in sorted(prefix_counts.keys()):
+    # 접두어별 저장 파일 수 (저장에 실패한 그룹은 제외)
+    from collections import Counter
+    prefix_counts = Counter(prefix3 for (prefix3, _, _, _), err in zip(jobs, errors) if not err)
+    for pfx in sorted(prefix_counts):
         print(f"[group] {pfx}: {prefix_counts[pfx]}개 파일 저장")
 
     return 0
 
 
+def _extract_last_row(path: Path, col4_idx: int) -> Tuple[Optional[Tuple[pd.Index, List[object]]], List[str]]:
+    # 파일 하나의 마지막(평균) 행을 (열 이름, 값 목록)으로 꺼내고 preform 값을 보정.
+    # 스레드에서 실행되므로 메시지는 모아서 반환
+    msgs: List[str] = []
+    try:
+        df = read_intermediate(path)
+    except Exception as e:
+        msgs.append(f"[collect-avg][경고] 읽기 실패: {path.name} → {e}")
+        return None, msgs
+    if df.empty:
+        msgs.append(f"[collect-avg][건너뜀] 빈 파일: {path.name}")
+        return None, msgs
+
+    last_idx = len(df) - 1
+    if df.shape[1] > col4_idx and last_idx >= 1:
+        if is_empty(df.iat[last_idx, col4_idx]):
+            df.iat[last_idx, col4_idx] = df.iat[last_idx - 1, col4_idx]
+
+    try:
+        current_val = df.iat[last_idx, col4_idx] if df.shape[1] > col4_idx else None
+        new_preform = preform_from_filename(path, fallback=str(current_val) if current_val is not None else None)
+        if new_preform is not None and df.shape[1] > col4_idx:
+            df.iloc[:, col4_idx] = df.iloc[:, col4_idx].astype("object")
+            df.iat[last_idx, col4_idx] = new_preform
+    except Exception as e:
+        msgs.append(f"[collect-avg][경고] {path.name}: preform 덮어쓰기 오류 → {e}")
+
+    return (df.columns, df.iloc[last_idx].tolist()), msgs
+
+
 def step_collect_all_prefix_averages(cfg: Config) -> int:
     print("[collect-avg] 접두어별 평균행 취합")
     base = cfg.out_grouped_by_col4
@@ -486,57 +996,89 @@ def step_collect_all_prefix_averages(cfg: Config) -> int:
         print(f"[collect-avg][오류] 폴더가 없습니다: {base.resolve()}")
         return 1
 
-    prefix_dirs = sorted(p for p in base.iterdir() if p.is_dir() and not p.name.startswith("~$"))
+    prefix_dirs = sorted(scan_subdirs(base))
     if not prefix_dirs:
         print("[collect-avg] 처리할 접두 폴더가 없습니다.")
         return 0
 
-    for pdir in prefix_dirs:
-        out_file = pdir / f"{pdir.name}.xlsx"
-        excel_files = candidate_files(pdir)
-        if not excel_files:
-            print(f"[collect-avg][INFO] {pdir.name}: 수집할 파일 없음")
-            continue
-
-        last_rows: List[pd.DataFrame] = []
-        for path in excel_files:
-            try:
-                df = pd.read_excel(path, engine="openpyxl")
-            except Exception as e:
-                print(f"[collect-avg][경고] 읽기 실패: {path.name} → {e}")
-                continue
-            if df.empty:
-                print(f"[collect-avg][건너뜀] 빈 파일: {path.name}")
+    # 파일 읽기는 서로 독립적인 I/O → 스레드로 동시에 읽고, 결과/메시지는 파일 순서대로 처리
+    extract = functools.partial(_extract_last_row, col4_idx=cfg.col4_idx)
+    with ThreadPoolExecutor(max_workers=cfg.max_workers) as tpe:
+        for pdir in prefix_dirs:
+            out_file = pdir / f"{pdir.name}.xlsx"
+            excel_files = candidate_files(pdir)
+            if not excel_files:
+                print(f"[collect-avg][INFO] {pdir.name}: 수집할 파일 없음")
                 continue
 
-            last_idx = len(df) - 1
-            if df.shape[1] > cfg.col4_idx and last_idx >= 1:
-                if is_empty(df.iat[last_idx, cfg.col4_idx]):
-                    df.iat[last_idx, cfg.col4_idx] = df.iat[last_idx - 1, cfg.col4_idx]
+            last_rows: List[Tuple[pd.Index, List[object]]] = []
+            for row, msgs in tpe.map(extract, excel_files):
+                for m in msgs:
+                    print(m)
+                if row is not None:
+                    last_rows.append(row)
+
+            if not last_rows:
+                print(f"[collect-avg][INFO] {pdir.name}: 평균 행 없음")
+                continue
 
+            # 보통 모든 파일의 열 구성이 같음 → 값 목록으로 DataFrame 한 번에 생성 (1행짜리 DataFrame 연결 없음)
+            columns = last_rows[0][0]
+            if all(cols.equals(columns) for cols, _ in last_rows):
+                result = pd.DataFrame([vals for _, vals in last_rows], columns=columns)
+            else:
+                result = pd.concat(
+                    [pd.DataFrame([vals], columns=cols) for cols, vals in last_rows],
+                    ignore_index=True, sort=False,
+                )
             try:
-                current_val = df.iat[last_idx, cfg.col4_idx] if df.shape[1] > cfg.col4_idx else None
-                new_preform = preform_from_filename(path, fallback=str(current_val) if current_val is not None else None)
-                if new_preform is not None and df.shape[1] > cfg.col4_idx:
-                    df.iloc[:, cfg.col4_idx] = df.iloc[:, cfg.col4_idx].astype("object")
-                    df.iat[last_idx, cfg.col4_idx] = new_preform
+                write_df_xlsx(result, out_file)
+                print(f"[collect-avg][저장] {out_file.resolve()} (총 {len(result)}행)")
             except Exception as e:
-                print(f"[collect-avg][경고] {path.name}: preform 덮어쓰기 오류 → {e}")
+                print(f"[collect-avg][오류] {pdir.name} 저장 실패 → {e}")
 
-            last_rows.append(df.iloc[[last_idx]].copy())
+    return 0
 
-        if not last_rows:
-            print(f"[collect-avg][INFO] {pdir.name}: 평균 행 없음")
-            continue
 
-        result = pd.concat(last_rows, ignore_index=True, sort=False)
-        try:
-            result.to_excel(out_file, index=False, engine="openpyxl")
-            print(f"[collect-avg][저장] {out_file.resolve()} (총 {len(result)}행)")
-        except Exception as e:
-            print(f"[collect-avg][오류] {pdir.name} 저장 실패 → {e}")
+_COPY42_SECOND_COL_IDX = 1
+_COPY42_FOURTH_COL_IDX = 3
 
-    return 0
+
+def _copy_col4_to_col2_book(pdir: Path) -> List[str]:
+    # 접두어 통합파일 하나 처리 (프로세스 풀 워커에서 실행). 출력 메시지는 모아서 반환
+    msgs: List[str] = []
+    target_xlsx = pdir / f"{pdir.name}.xlsx"
+    if not target_xlsx.exists():
+        msgs.append(f"[copy-42][건너뜀] 대상 파일 없음: {target_xlsx}")
+        return msgs
+
+    try:
+        df = pd.read_excel(target_xlsx, engine=READ_ENGINE)
+    except Exception as e:
+        msgs.append(f"[copy-42][오류] 읽기 실패: {target_xlsx.name} → {e}")
+        return msgs
+
+    if df.empty:
+        msgs.append(f"[copy-42][건너뜀] 빈 파일: {target_xlsx.name}")
+        return msgs
+
+    needed = max(_COPY42_SECOND_COL_IDX, _COPY42_FOURTH_COL_IDX) + 1
+    if df.shape[1] < needed:
+        msgs.append(f"[copy-42][경고] {target_xlsx.name}: 열 수 부족({df.shape[1]}열) → 복사 스킵")
+        return msgs
+
+    dst_col = df.columns[_COPY42_SECOND_COL_IDX]
+    src_col = df.columns[_COPY42_FOURTH_COL_IDX]
+
+    # 2번째 열은 통째로 덮어쓰므로 4번째 열만 문자열로 정규화
+    df[dst_col] = _normalize_as_text(df[src_col])
+
+    try:
+        write_df_xlsx(df, target_xlsx)
+        msgs.append(f"[copy-42][완료] {target_xlsx}")
+    except Exception as e:
+        msgs.append(f"[copy-42][오류] 저장 실패: {target_xlsx.name} → {e}")
+    return msgs
 
 
 def step_copy_col4_to_col2_in_prefix_books(cfg: Config) -> int:
@@ -546,47 +1088,23 @@ def step_copy_col4_to_col2_in_prefix_books(cfg: Config) -> int:
         print(f"[copy-42][오류] 폴더 없음: {root.resolve()}")
         return 1
 
-    SECOND_COL_IDX = 1
-    FOURTH_COL_IDX = 3
-
-    prefix_dirs = sorted(p for p in root.iterdir() if p.is_dir() and not _is_temp_or_hidden(p))
+    prefix_dirs = sorted(p for p in scan_subdirs(root) if not _is_temp_or_hidden(p))
     if not prefix_dirs:
         print("[copy-42][정보] 처리할 접두어 폴더가 없습니다.")
         return 0
 
-    for pdir in prefix_dirs:
-        target_xlsx = pdir / f"{pdir.name}.xlsx"
-        if not target_xlsx.exists():
-            print(f"[copy-42][건너뜀] 대상 파일 없음: {target_xlsx}")
-            continue
-
-        try:
-            df = pd.read_excel(target_xlsx, engine="openpyxl")
-        except Exception as e:
-            print(f"[copy-42][오류] 읽기 실패: {target_xlsx.name} → {e}")
-            continue
-
-        if df.empty:
-            print(f"[copy-42][건너뜀] 빈 파일: {target_xlsx.name}")
-            continue
-
-        needed = max(SECOND_COL_IDX, FOURTH_COL_IDX) + 1
-        if df.shape[1] < needed:
-            print(f"[copy-42][경고] {target_xlsx.name}: 열 수 부족({df.shape[1]}열) → 복사 스킵")
-            continue
-
-        dst_col = df.columns[SECOND_COL_IDX]
-        src_col = df.columns[FOURTH_COL_IDX]
-
-        df[dst_col] = _normalize_as_text(df[dst_col])
-        src_as_text = _normalize_as_text(df[src_col])
-        df[dst_col] = src_as_text
+    # 접두어 파일끼리는 독립적 → 읽기/저장을 프로세스 풀로 분산 (출력 순서는 폴더명 순 유지)
+    workers = resolve_workers(cfg, len(prefix_dirs))
+    if workers <= 1:
+        for pdir in prefix_dirs:
+            for m in _copy_col4_to_col2_book(pdir):
+                print(m)
+        return 0
 
-        try:
-            df.to_excel(target_xlsx, index=False, engine="openpyxl")
-            print(f"[copy-42][완료] {target_xlsx}")
-        except Exception as e:
-            print(f"[copy-42][오류] 저장 실패: {target_xlsx.name} → {e}")
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for msgs in ex.map(_copy_col4_to_col2_book, prefix_dirs):
+            for m in msgs:
+                print(m)
 
     return 0
 
@@ -599,31 +1117,28 @@ def step_summarize_types(cfg: Config) -> int:
         return 1
 
     folder_names = set()
-    for p in base.iterdir():
-        if p.is_dir():
-            name = p.name.strip()
-            if name and not name.startswith("~$") and not name.startswith("."):
-                folder_names.add(name.upper())
+    for p in scan_subdirs(base):
+        name = p.name.strip()
+        if name and not name.startswith("~$") and not name.startswith("."):
+            folder_names.add(name.upper())
 
     print("[types] 현재 보유 폴더 코드:", ", ".join(sorted(folder_names)) if folder_names else "(없음)")
 
-    defined_upper = set()
-    for vendors in cfg.type_map.values():
-        for codes in vendors.values():
-            defined_upper.update(c.upper() for c in codes)
+    # 코드 대문자 변환은 한 번만: 타입 → 제조사 → [(원래 코드, 대문자 코드)]
+    type_codes = {
+        type_name: {vendor: [(c, c.upper()) for c in codes] for vendor, codes in vendors.items()}
+        for type_name, vendors in cfg.type_map.items()
+    }
+    defined_upper = {u for vendors in type_codes.values() for pairs in vendors.values() for _, u in pairs}
 
-    matched_present_upper = set()
     any_printed = False
 
-    for type_name, vendors in cfg.type_map.items():
+    for type_name, vendors in type_codes.items():
         vendor_parts = []
-        for vendor, codes in vendors.items():
-            if not codes:
-                continue
-            present_codes = [c for c in codes if c.upper() in folder_names]
+        for vendor, pairs in vendors.items():
+            present_codes = [c for c, u in pairs if u in folder_names]
             if present_codes:
                 vendor_parts.append(f"{vendor}=" + ", ".join(present_codes))
-                matched_present_upper.update(c.upper() for c in present_codes)
         if vendor_parts:
             any_printed = True
             print(f"[types] 타입 {type_name}: " + " / ".join(vendor_parts) + " 보유")
@@ -687,60 +1202,155 @@ COLUMN_INFO: List[Tuple[str, Optional[int], Optional[str], Optional[float]]] = [
 ]
 
 
-def _safe_series(df: pd.DataFrame, col: Optional[int]) -> pd.Series:
-    if col is None or col >= df.shape[1]:
-        return pd.Series([], dtype="float64")
-    return df.iloc[1:, col]
+# COLUMN_INFO를 열 단위 배열(SoA)로 분해 — 리포트 생성 시 종류별로 한 번에 처리
+REPORT_TITLES: List[str] = [title for title, _, _, _ in COLUMN_INFO]
+REPORT_SRC_COLS = np.array([-1 if c is None else c for _, c, _, _ in COLUMN_INFO], dtype=np.int16)
+REPORT_FACTORS = np.array([1.0 if f is None else f for _, _, _, f in COLUMN_INFO], dtype=np.float64)
+
+# 계산 종류 → 코드. 열마다 문자열을 비교하지 않고 코드 배열로 한 번에 분류
+# (COLUMN_INFO에 모르는 종류가 있으면 모듈 로드 시 KeyError로 바로 드러남)
+REPORT_CALC_KINDS: Dict[Optional[str], int] = {None: 0, "scale": 1, "delta": 2, "mac": 3}
+REPORT_KIND = np.array([REPORT_CALC_KINDS[calc] for _, _, calc, _ in COLUMN_INFO], dtype=np.int8)
+REPORT_IS_SCALE = REPORT_KIND == REPORT_CALC_KINDS["scale"]
+REPORT_IS_DELTA = REPORT_KIND == REPORT_CALC_KINDS["delta"]
+REPORT_IS_MAC = REPORT_KIND == REPORT_CALC_KINDS["mac"]
+
+# 리포트 엑셀을 header=None으로 읽었을 때의 제목 행 (빈 제목 셀은 NaN)
+REPORT_HEADERS: List[object] = [t if t else np.nan for t in REPORT_TITLES]
+
+# 계산 열이 참조하는 리포트 열 인덱스(0-based)
+DELTA_CUT_2M_OE, DELTA_CUT_22M = 19, 20  # delta = Cutoff 2m O/E - Cutoff 22m
+MAC_MFD_OE, MAC_CUT_2M_IE = 11, 18       # mac = MFD 1310nm O/E / Cutoff 2m I/E * 1000
+
+# 숫자 계산에 쓰이는 원본 열(배율 열 + delta/mac 참조 열) — 로드 직후 한 번만 float64로 변환
+REPORT_NUMERIC_SRC: List[int] = sorted(
+    {int(c) for c in REPORT_SRC_COLS[REPORT_IS_SCALE]}
+    | {int(REPORT_SRC_COLS[i]) for i in (DELTA_CUT_2M_OE, DELTA_CUT_22M, MAC_MFD_OE, MAC_CUT_2M_IE)}
+)
+
+# 계산 열(배율 → delta → mac 순)과 숫자 블록 안에서 참조하는 위치
+_NUM_POS = {c: i for i, c in enumerate(REPORT_NUMERIC_SRC)}
+REPORT_SCALE_IDX = np.flatnonzero(REPORT_IS_SCALE)
+REPORT_CALC_IDX = np.concatenate(
+    [REPORT_SCALE_IDX, np.flatnonzero(REPORT_IS_DELTA), np.flatnonzero(REPORT_IS_MAC)]
+)
+_SCALE_POS = np.array([_NUM_POS[int(c)] for c in REPORT_SRC_COLS[REPORT_SCALE_IDX]], dtype=np.intp)
+_SCALE_FACTORS = REPORT_FACTORS[REPORT_SCALE_IDX]
+_N_DELTA = int(REPORT_IS_DELTA.sum())
+_DELTA_A, _DELTA_B, _MAC_A, _MAC_B = (
+    _NUM_POS[int(REPORT_SRC_COLS[i])] for i in (DELTA_CUT_2M_OE, DELTA_CUT_22M, MAC_MFD_OE, MAC_CUT_2M_IE)
+)
+
+
+def _compute_derived(num: np.ndarray) -> np.ndarray:
+    """숫자 블록(행 x REPORT_NUMERIC_SRC)에서 배율/delta/mac 열을 한 번에 계산.
+
+    결과는 (행 x REPORT_CALC_IDX) float64 배열. 미리 잡아둔 버퍼에 ufunc(out=)로 바로 써서
+    열마다 임시 배열을 만들지 않는다.
+    """
+    n_scale = len(REPORT_SCALE_IDX)
+    res = np.empty((num.shape[0], len(REPORT_CALC_IDX)), dtype=np.float64)
+
+    scaled = res[:, :n_scale]
+    np.multiply(num[:, _SCALE_POS], _SCALE_FACTORS, out=scaled)
+    np.round(scaled, 4, out=scaled)
+
+    delta = res[:, n_scale:n_scale + _N_DELTA]
+    np.subtract(num[:, _DELTA_A, None], num[:, _DELTA_B, None], out=delta)
+    np.round(delta, 4, out=delta)
+
+    mac = res[:, n_scale + _N_DELTA:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(num[:, _MAC_A, None], num[:, _MAC_B, None], out=mac)
+    np.multiply(mac, 1000, out=mac)
+    np.round(mac, 2, out=mac)
+    return res
+
+
+def _drop_trailing_blank_rows(df: pd.DataFrame) -> pd.DataFrame:
+    # 엑셀로 저장했다 읽으면 끝의 빈 행(모든 셀이 NaN/빈 문자열)은 사라짐 → 사본도 같은 행 수로 맞춤
+    filled = np.flatnonzero((df.notna() & df.ne("")).any(axis=1).to_numpy())
+    n = int(filled[-1]) + 1 if len(filled) else 0
+    return df if n == len(df) else df.iloc[:n]
 
 
-def build_folder_report(subfolder: Path) -> Optional[Path]:
+def _write_report_sidecar(out: pd.DataFrame, dst: Path) -> None:
+    # 리포트 본문(제목 행 제외)을 .parquet 사본으로 저장. 실패 시 오래된 사본이 남지 않도록 삭제
+    sidecar = dst.with_suffix(".parquet")
+    if not HAS_PARQUET:
+        return
+    try:
+        body = _drop_trailing_blank_rows(out).copy()
+        body.columns = [str(c) for c in body.columns]
+        body.to_parquet(sidecar, index=False, compression="zstd")
+    except Exception as e:
+        sidecar.unlink(missing_ok=True)
+        print(f"[report](정보) parquet 사본 생략({dst.name}): {e}")
+
+
+def build_folder_report(subfolder: Path, force: bool = False) -> Optional[Path]:
     src = pick_input_file(subfolder)
     if src is None:
         print(f"[report]❌ 입력 없음: {subfolder.name} (<폴더명>.xlsx / final.xlsx)")
         return None
 
+    # 입력 내용이 지난번 리포트를 만들 때와 같으면 다시 만들지 않음 (--force로 무시)
+    # collect-avg가 매 실행마다 입력을 다시 저장하므로 수정 시각이 아닌 내용 해시로 비교
+    dst = subfolder / f"{subfolder.name}_final_result_report.xlsx"
+    stamp = dst.with_suffix(".digest")
+    digest = _xlsx_content_digest(src)
+    if not force and dst.exists() and stamp.exists() and stamp.read_text(encoding="ascii", errors="replace") == digest:
+        print(f"[report]⏭️ 최신 상태, 건너뜀: {dst}")
+        return dst
+    stamp.unlink(missing_ok=True)  # 저장이 중간에 실패해도 예전 해시가 새 리포트와 짝지어지지 않게
+
     try:
-        df = pd.read_excel(src, header=None, engine="openpyxl")
+        df = read_sheet_raw(src)  # 입력은 collect-avg가 매번 다시 쓰는 파일이라 캐시하지 않음
     except Exception as e:
         print(f"[report]⚠️ 읽기 오류({subfolder.name}): {e}")
         return None
 
-    out = pd.DataFrame()
-    for out_idx, (title, src_col, calc, factor) in enumerate(COLUMN_INFO):
-        out.loc[0, out_idx] = title
-        if calc is None:
-            if src_col is None:
-                continue
-            series = _safe_series(df, src_col)
-            for r, v in enumerate(series.tolist()):
-                out.loc[r + 1, out_idx] = v
-        elif calc == "delta":
-            col_20 = pd.to_numeric(out.iloc[1:, 19], errors="coerce")
-            col_21 = pd.to_numeric(out.iloc[1:, 20], errors="coerce")
-            delta = (col_20 - col_21).round(4)
-            for r, v in enumerate(delta.tolist(), start=1):
-                out.loc[r, out_idx] = "" if pd.isna(v) else v
-        elif calc == "mac":
-            mfd_oe = pd.to_numeric(out.iloc[1:, 11], errors="coerce")
-            cut_ie = pd.to_numeric(out.iloc[1:, 18], errors="coerce")
-            mac = (mfd_oe / cut_ie * 1000).round(2)
-            for r, v in enumerate(mac.tolist(), start=1):
-                out.loc[r, out_idx] = "" if pd.isna(v) else v
-        elif calc == "scale":
-            series = _safe_series(df, src_col)
-            scaled = (pd.to_numeric(series, errors="coerce") * (factor or 1.0)).round(4)
-            for r, v in enumerate(scaled.tolist()):
-                out.loc[r + 1, out_idx] = "" if pd.isna(v) else v
+    # 원본 1행은 헤더, 2행부터 데이터. 원본에 없는 열은 빈칸으로 남김
+    # 열마다 고유 dtype(숫자 열은 float64)을 유지하도록 object 행렬 대신 열 묶음으로 조립
+    body = df.iloc[1:].reset_index(drop=True).infer_objects()
+    present = (REPORT_SRC_COLS >= 0) & (REPORT_SRC_COLS < df.shape[1])
+
+    # 계산용 숫자 블록: 필요한 원본 열만 한 번에 float64로 고정 (숫자가 아닌 셀/없는 열은 NaN)
+    num_cols = [c for c in REPORT_NUMERIC_SRC if c < df.shape[1]]
+    num = body.iloc[:, num_cols].apply(pd.to_numeric, errors="coerce").astype(np.float64)
+    num.columns = num_cols
+    num = num.reindex(columns=REPORT_NUMERIC_SRC)
+
+    # (1) 그대로 복사하는 열: 한 번의 fancy-indexing으로 일괄 복사 (원본 값 유지)
+    copy_idx = np.flatnonzero(present & ~REPORT_IS_SCALE)
+    copied = body.iloc[:, REPORT_SRC_COLS[copy_idx]]
+    copied.columns = copy_idx
+
+    # (2) 배율/delta/mac 계산 열: 숫자 블록 하나로 한 번에 계산
+    calc = pd.DataFrame(_compute_derived(num.to_numpy()), columns=REPORT_CALC_IDX)
+
+    out = pd.concat([copied, calc], axis=1).reindex(columns=range(len(REPORT_TITLES)))
 
-    dst = subfolder / f"{subfolder.name}_final_result_report.xlsx"
     try:
-        out.to_excel(dst, index=False, header=False, engine="openpyxl")
+        # 1행은 제목(서식 없는 일반 행), 2행부터 데이터 — 행 순서대로 스트리밍 저장
+        write_rows_xlsx(dst, itertools.chain([REPORT_TITLES], out.itertuples(index=False, name=None)))
         print(f"[report]✅ 저장: {dst}")
-        return dst
     except Exception as e:
         print(f"[report]⚠️ 저장 오류({subfolder.name}): {e}")
         return None
 
+    _write_report_sidecar(out, dst)
+    stamp.write_text(digest, encoding="ascii")
+    return dst
+
+
+def _build_folder_report_captured(subfolder: Path, force: bool = False) -> str:
+    # 워커 프로세스의 출력은 부모의 로그(_Tee)에 남지 않으므로 문자열로 받아 부모에서 출력
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        build_folder_report(subfolder, force)
+    return buf.getvalue()
+
 
 def step_build_reports(cfg: Config) -> int:
     print("[reports] 하위 폴더별 *_final_result_report.xlsx 생성")
@@ -749,45 +1359,100 @@ def step_build_reports(cfg: Config) -> int:
         print(f"[reports][오류] 폴더 없음: {root.resolve()}")
         return 1
 
-    subfolders = [p for p in root.iterdir() if p.is_dir() and not p.name.startswith(("~$", "."))]
+    subfolders = scan_subdirs(root)
     if not subfolders:
         print("[reports] 처리할 하위 폴더가 없습니다.")
         return 0
 
-    for sub in sorted(subfolders, key=lambda x: x.name):
-        build_folder_report(sub)
+    subfolders = sorted(subfolders, key=lambda x: x.name)
+    workers = resolve_workers(cfg, len(subfolders))
+    if workers <= 1:
+        for sub in subfolders:
+            build_folder_report(sub, cfg.force_rebuild)
+        return 0
+
+    # 하위 폴더는 서로 독립적이므로 프로세스 풀로 분산 (출력 순서는 폴더명 순 유지)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        task = functools.partial(_build_folder_report_captured, force=cfg.force_rebuild)
+        for text in ex.map(task, subfolders):
+            print(text, end="")
 
     return 0
 
 
-def collect_to_root(root: Path, total_filename: str = "total_final_result.xlsx") -> Optional[Path]:
+def _read_report(p: Path) -> Optional[pd.DataFrame]:
+    # 리포트보다 새로운 .parquet 사본이 있으면 그것을 사용 (엑셀 파싱 생략)
+    sidecar = p.with_suffix(".parquet")
+    if HAS_PARQUET and sidecar.exists() and sidecar.stat().st_mtime >= p.stat().st_mtime:
+        data = pd.read_parquet(sidecar)
+        if data.shape[1] == len(REPORT_HEADERS):
+            data.columns = REPORT_HEADERS
+            return _drop_trailing_blank_rows(data)  # 이전 버전이 빈 행까지 저장한 사본 대비
+
+    raw = pd.read_excel(p, header=None, engine=READ_ENGINE)
+    if raw.empty:
+        return None
+    headers = raw.iloc[0].tolist()
+    data = raw.iloc[1:]  # 행은 itertuples(index=False)로만 쓰이므로 인덱스 재정렬(복사) 불필요
+    data.columns = headers
+    return data
+
+
+def _read_report_safe(p: Path) -> Tuple[Optional[pd.DataFrame], Optional[Exception]]:
+    try:
+        return _read_report(p), None
+    except Exception as e:
+        return None, e
+
+
+def collect_to_root(root: Path, total_filename: str = "total_final_result.xlsx",
+                    max_workers: Optional[int] = None) -> Optional[Path]:
     report_paths = sorted(root.glob("*/*_final_result_report.xlsx"))
     if not report_paths:
         print("[collect-total]⚠️ 통합할 리포트가 없습니다.")
         return None
 
-    merged_list: List[pd.DataFrame] = []
-    for p in report_paths:
-        try:
-            raw = pd.read_excel(p, header=None, engine="openpyxl")
-            if raw.empty:
-                continue
-            headers = raw.iloc[0].tolist()
-            data = raw.iloc[1:].reset_index(drop=True)
-            data.columns = headers
-            data.insert(0, "GROUP", p.parent.name)
-            merged_list.append(data)
-        except Exception as e:
-            print(f"[collect-total]⚠️ 통합 중 읽기 오류: {p} → {e}")
-
-    if not merged_list:
+    header: Optional[pd.Index] = None
+
+    def total_rows():
+        # 리포트를 읽는 대로 행을 바로 흘려보냄 (전체를 하나의 DataFrame으로 합치지 않음)
+        # 읽기는 스레드로 동시에 수행하되 앞서 읽는 리포트는 workers개까지만 (메모리에는 그만큼만 올라감)
+        # 행 순서는 경로 정렬 순서 유지
+        nonlocal header
+        workers = max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as tpe:
+            todo = iter(report_paths)
+            pending = deque((p, tpe.submit(_read_report_safe, p)) for p in itertools.islice(todo, workers))
+            while pending:
+                p, fut = pending.popleft()
+                data, err = fut.result()
+                nxt = next(todo, None)
+                if nxt is not None:
+                    pending.append((nxt, tpe.submit(_read_report_safe, nxt)))
+                if err is not None:
+                    print(f"[collect-total]⚠️ 통합 중 읽기 오류: {p} → {err}")
+                    continue
+                if data is None:
+                    continue
+                if header is None:
+                    header = data.columns
+                    yield ["GROUP", *header]
+                elif not data.columns.equals(header):
+                    print(f"[collect-total]⚠️ 열 구성이 달라 제외: {p}")
+                    continue
+                group = p.parent.name
+                for row in data.itertuples(index=False, name=None):
+                    yield (group, *row)
+
+    rows = total_rows()
+    first = next(rows, None)
+    if first is None:
         print("[collect-total]⚠️ 유효 데이터가 없습니다.")
         return None
 
-    total_df = pd.concat(merged_list, ignore_index=True, sort=False)
     total_path = root / total_filename
     try:
-        total_df.to_excel(total_path, index=False, engine="openpyxl")
+        write_rows_xlsx(total_path, itertools.chain([first], rows))
         print(f"[collect-total]📦 저장: {total_path}")
         print("[collect-total] 통합모드 엑셀파일 작성완료")
         return total_path
@@ -802,7 +1467,7 @@ def step_collect_total(cfg: Config) -> int:
     if not root.exists():
         print(f"[collect-total][오류] 폴더 없음: {root.resolve()}")
         return 1
-    collect_to_root(root, "total_final_result.xlsx")
+    collect_to_root(root, "total_final_result.xlsx", cfg.max_workers)
     return 0
 
 
@@ -829,7 +1494,7 @@ def step_post_analyze_and_highlight(cfg: Config) -> int:
         return 1
 
     try:
-        df = pd.read_excel(total_xlsx, engine="openpyxl")
+        df = pd.read_excel(total_xlsx, engine=READ_ENGINE)
     except Exception as e:
         print(f"[post-analyze][오류] 통합 파일 읽기 실패: {e}")
         return 1
@@ -847,7 +1512,8 @@ def step_post_analyze_and_highlight(cfg: Config) -> int:
         print(f"[post-analyze][오류] 열 수가 부족합니다. (현재 {work.shape[1]}열, 필요 {max_needed+1}열)")
         return 1
 
-    # 숫자 변환
+    # 숫자 변환 (2번째 열은 출력용 값 배열로 한 번만 꺼내 둠)
+    sec_arr = work.iloc[:, COL_SECOND].to_numpy()
     s_delta = pd.to_numeric(work.iloc[:, COL_DELTA], errors="coerce")
     s_clad_ie = pd.to_numeric(work.iloc[:, COL_CLAD_IE], errors="coerce")
     s_clad_oe = pd.to_numeric(work.iloc[:, COL_CLAD_OE], errors="coerce")
@@ -856,69 +1522,63 @@ def step_post_analyze_and_highlight(cfg: Config) -> int:
     print("결과를 분석합니다.")
     print("1. delta(2m)-22m 검사 수행")
 
-    valid_delta = s_delta.dropna()
+    # float64 배열 하나로 최솟값/최댓값과 해당 행 위치를 구함 (pandas 인덱스 조회 없음)
+    delta_arr = s_delta.to_numpy(dtype=np.float64)
+    valid_delta = delta_arr[~np.isnan(delta_arr)]
     min_idx_list: List[int] = []
     max_idx_list: List[int] = []
-    if valid_delta.empty:
+    delta_mark = np.zeros(len(delta_arr), dtype=bool)
+    if valid_delta.size == 0:
         print("[post-analyze] delta(2m)-22m 유효 데이터가 없습니다.")
     else:
         min_val = valid_delta.min()
         max_val = valid_delta.max()
-        min_idx_list = s_delta.index[s_delta == min_val].tolist()
-        max_idx_list = s_delta.index[s_delta == max_val].tolist()
+        is_min = delta_arr == min_val
+        is_max = delta_arr == max_val
+        min_idx_list = np.flatnonzero(is_min).tolist()
+        max_idx_list = np.flatnonzero(is_max).tolist()
+        delta_mark = is_min | is_max
 
         print("delta(2m)-22m의 최댓값, 최솟값은 다음과 같습니다.")
-        for ridx in min_idx_list:
-            sec_val = work.iat[ridx, COL_SECOND]
+        for sec_val in sec_arr[min_idx_list]:
             print(f"  · 최솟값: {min_val}  |  2번째 열 값: {sec_val}")
-        for ridx in max_idx_list:
-            sec_val = work.iat[ridx, COL_SECOND]
+        for sec_val in sec_arr[max_idx_list]:
             print(f"  · 최댓값: {max_val}  |  2번째 열 값: {sec_val}")
 
     print()
     print("2. cladding dia 검사 수행")
     LOW, HIGH = 124.3, 125.7
 
-    ie_out_mask = (s_clad_ie < LOW) | (s_clad_ie > HIGH)
-    oe_out_mask = (s_clad_oe < LOW) | (s_clad_oe > HIGH)
-
-    any_abnormal = False
-    for ridx in ie_out_mask[ie_out_mask].index.tolist():
-        any_abnormal = True
-        sec_val = work.iat[ridx, COL_SECOND]
-        val = s_clad_ie.iat[ridx]
-        print(f"이상값 발견: Clad Dia. I/E = {val} (행 {ridx})  |  2번째 열 값: {sec_val}")
-    for ridx in oe_out_mask[oe_out_mask].index.tolist():
-        any_abnormal = True
-        sec_val = work.iat[ridx, COL_SECOND]
-        val = s_clad_oe.iat[ridx]
-        print(f"이상값 발견: Clad Dia. O/E = {val} (행 {ridx})  |  2번째 열 값: {sec_val}")
-
-    if not any_abnormal:
-        print("이상값 없음")
+    # 범위 밖 여부는 배열로 한 번만 계산해 출력과 빨간 표시에 같이 사용
+    ie_vals = s_clad_ie.to_numpy()
+    oe_vals = s_clad_oe.to_numpy()
+    ie_out = (ie_vals < LOW) | (ie_vals > HIGH)
+    oe_out = (oe_vals < LOW) | (oe_vals > HIGH)
 
-    # ── 스타일 적용 준비 (빨간 글자색) ──────────────────────
-    style_df = pd.DataFrame("", index=work.index, columns=work.columns)
+    # 이상 행만 골라 값/행 번호/2번째 열 값을 배열째 묶어 출력 (행마다 iat 조회 없음)
+    for label, vals, out in (("I/E", ie_vals, ie_out), ("O/E", oe_vals, oe_out)):
+        for val, ridx, sec_val in zip(vals[out], work.index[out], sec_arr[out]):
+            print(f"이상값 발견: Clad Dia. {label} = {val} (행 {ridx})  |  2번째 열 값: {sec_val}")
 
-    for ridx in min_idx_list:
-        style_df.iat[ridx, COL_DELTA] = "color: red;"
-    for ridx in max_idx_list:
-        style_df.iat[ridx, COL_DELTA] = "color: red;"
+    if not (ie_out.any() or oe_out.any()):
+        print("이상값 없음")
 
-    for ridx in ie_out_mask[ie_out_mask].index.tolist():
-        style_df.iat[ridx, COL_CLAD_IE] = "color: red;"
-    for ridx in oe_out_mask[oe_out_mask].index.tolist():
-        style_df.iat[ridx, COL_CLAD_OE] = "color: red;"
+    # ── 스타일 적용 준비 (빨간 글자색) ──────────────────────
+    # 셀 단위 iat 대입 대신 마스크로 열 단위 일괄 지정
+    red = np.zeros(work.shape, dtype=bool)
+    red[delta_mark, COL_DELTA] = True
+    red[ie_out, COL_CLAD_IE] = True
+    red[oe_out, COL_CLAD_OE] = True
 
     annotated_path = root / "total_final_result_annotated.xlsx"
     try:
-        styler = work.style.apply(lambda _: style_df, axis=None)
-        styler.to_excel(annotated_path, index=False, engine="openpyxl")
+        # 행 단위 스트리밍 저장, 표시할 셀에만 빨간 글자 서식 (Styler의 셀별 CSS 변환 없음)
+        write_df_xlsx_marked(work, annotated_path, red)
         print(f"[post-analyze] 스타일 적용 파일 저장: {annotated_path.name}")
     except Exception as e:
         print(f"[post-analyze][경고] 스타일 적용 저장 실패: {e}")
         try:
-            work.to_excel(annotated_path, index=False, engine="openpyxl")
+            write_df_xlsx(work, annotated_path)
             print(f"[post-analyze] 데이터만 저장 완료(스타일 미포함): {annotated_path.name}")
         except Exception as e2:
             print(f"[post-analyze][오류] 데이터 저장도 실패: {e2}")
@@ -959,6 +1619,10 @@ DEFAULT_ORDER = [
 ]
 
 
+# app.py(인프로세스 실행)의 중지 버튼 → 다음 단계 시작 전에 확인
+STOP_EVENT = threading.Event()
+
+
 def run_steps(step_keys: Iterable[str], cfg: Config) -> int:
     env = setup_utf8_console_and_env()
     logger = Logger(cfg)
@@ -976,6 +1640,9 @@ def run_steps(step_keys: Iterable[str], cfg: Config) -> int:
     failed: List[Tuple[str, int]] = []
 
     for i, key in enumerate(step_keys, start=1):
+        if STOP_EVENT.is_set():
+            print("[중지] 사용자 요청으로 이후 단계를 실행하지 않습니다.")
+            break
         executed += 1
         title, fn = STEPS[key]
         tag = f"[{i}/{total}]"
@@ -991,6 +1658,7 @@ def run_steps(step_keys: Iterable[str], cfg: Config) -> int:
         print("-" * 100)
         status = "성공" if rc == 0 else f"실패(rc={rc})"
         print(f"{tag} {key} 종료 | {status} | 소요 {elapsed:.2f}s\n")
+        logger.flush()
 
         if rc != 0:
             failed.append((key, rc))
@@ -1032,6 +1700,13 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     p.add_argument("--use-wpattern-first", action="store_true", help="접두 추출 시 W-패턴 우선")
     p.add_argument("--no-second-last-zero-filter", action="store_true", help="C열의 뒤에서 2번째=0 필터 비활성화")
     p.add_argument("--no-stop-on-error", action="store_true", help="오류 발생해도 계속 진행")
+    p.add_argument("--cache-dir", dest="cache_dir", type=Path, default=CFG.cache_dir,
+                   help="ab/alls 파싱 캐시 폴더 (지정할 때만 사용, parquet·pyarrow 필요)")
+    p.add_argument("--no-cache", action="store_true", help="--cache-dir을 지정해도 캐시 사용 안 함")
+    p.add_argument("--force", dest="force_rebuild", action="store_true", help="최신 상태인 리포트도 다시 생성")
+    p.add_argument("--intermediate-format", dest="intermediate_format", choices=["xlsx", "parquet"],
+                   default=CFG.intermediate_format, help="중간 산출물(alls_cleaned, 그룹별 파일) 저장 형식")
+    p.add_argument("--workers", dest="max_workers", type=int, default=CFG.max_workers, help="병렬 작업 수 — 저장/리포트 프로세스, 읽기 스레드 (미지정 시 자동: 작업이 충분할 때만 프로세스 병렬, 1이면 순차)")
 
     sub = p.add_subparsers(dest="cmd")
 
@@ -1061,6 +1736,10 @@ def args_to_config(ns: argparse.Namespace) -> Config:
         use_w_pattern_first=bool(ns.use_wpattern_first),
         filter_second_last_zero=not bool(ns.no_second_last_zero_filter),
         stop_on_error=not bool(ns.no_stop_on_error),
+        max_workers=ns.max_workers,
+        cache_dir=None if ns.no_cache else ns.cache_dir,
+        force_rebuild=ns.force_rebuild,
+        intermediate_format=ns.intermediate_format,
     )
     return cfg
 
@@ -1086,4 +1765,6 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 
 if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -0,0 +1,220 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import new_main4 as nm  # noqa: E402
+
+
+def _write_report_input(path, rows, width=40):
+    # 리포트 입력(<폴더명>.xlsx): 1행은 헤더, 2행부터 데이터 — 열 위치만 의미가 있음
+    header = [f"c{i}" for i in range(width)]
+    body = [[row.get(i) for i in range(width)] for row in rows]
+    nm.write_rows_xlsx(path, [header, *body])
+
+
+def _total_rows(root):
+    total = nm.collect_to_root(root)
+    assert total is not None
+    return nm.read_sheet_raw(total).astype(object).where(lambda d: d.notna(), None).values.tolist()
+
+
+def test_collect_total_is_stable_with_report_sidecar(tmp_path):
+    pytest.importorskip("pyarrow")
+    if not nm.HAS_PARQUET:
+        pytest.skip("parquet sidecar disabled")
+
+    root = tmp_path / "grouped_by_col4"
+    sub = root / "ABC"
+    sub.mkdir(parents=True)
+    # 마지막 행은 리포트에 쓰이지 않는 열(3)에만 값이 있어 리포트에서는 빈 행이 됨
+    _write_report_input(sub / "ABC.xlsx", [
+        {1: "ABC00001A", 5: 0.33, 6: 0.34, 26: 1.5},
+        {1: "ABC00001B", 5: 0.35, 6: 0.36, 26: 2.5},
+        {3: "ABC00001"},
+    ])
+
+    report = nm.build_folder_report(sub)
+    assert report is not None and report.with_suffix(".parquet").exists()
+
+    first = _total_rows(root)
+    second = _total_rows(root)
+    report.with_suffix(".parquet").unlink()
+    from_xlsx = _total_rows(root)
+
+    assert first == second == from_xlsx
+    assert len(first) == 3  # 제목 행 + 데이터 2행 (끝의 빈 행 없음)
+
+
+def test_load_sheet_cached_is_opt_in_and_round_trips(tmp_path):
+    pytest.importorskip("pyarrow")
+    assert nm.Config().cache_dir is None
+
+    src = tmp_path / "ab.xlsx"
+    nm.write_rows_xlsx(src, [["draw_no", "len"], ["ABC00001", 1.5], ["ABC00002", None]])
+    cache_dir = tmp_path / "cache"
+
+    fresh = nm.load_sheet_cached(src, cache_dir, header=0)
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+    cached = nm.load_sheet_cached(src, cache_dir, header=0)
+    pd.testing.assert_frame_equal(cached, fresh)
+
+
+@pytest.mark.parametrize("header", [0, None])
+def test_load_sheet_cached_keeps_mixed_type_columns(tmp_path, header):
+    pytest.importorskip("pyarrow")
+    src = tmp_path / "alls.xlsx"
+    # 실제 ab/alls처럼 문자열·정수·실수·빈 칸이 한 열에 섞여 있어도 캐시되고 타입 그대로 되돌아와야 함
+    nm.write_rows_xlsx(src, [["a", "b"], [1, "x"], ["y", 2.5], [None, 3], [0.0, "0"]])
+    cache_dir = tmp_path / "cache"
+
+    fresh = nm.load_sheet_cached(src, cache_dir, header=header)
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+    cached = nm.load_sheet_cached(src, cache_dir, header=header)
+
+    pd.testing.assert_frame_equal(cached, fresh)
+    assert [[type(v) for v in row] for row in cached.values] == [[type(v) for v in row] for row in fresh.values]
+
+
+def test_prune_cache_drops_stale_and_oversized_entries(tmp_path):
+    now = time.time()
+    for name, age_days, size in [("old.pkl", 40, 10), ("a.parquet", 3, 60), ("b.parquet", 2, 60), ("c.parquet", 1, 60)]:
+        p = tmp_path / name
+        p.write_bytes(b"0" * size)
+        os.utime(p, (now - age_days * 86400,) * 2)
+
+    nm.prune_cache(tmp_path, max_age_days=30, max_bytes=130)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.parquet", "c.parquet"]
+
+
+def test_collect_total_reads_ahead_at_most_workers_reports(tmp_path, monkeypatch):
+    root = tmp_path / "grouped_by_col4"
+    for i in range(6):
+        sub = root / f"G{i}"
+        sub.mkdir(parents=True)
+        (sub / f"G{i}_final_result_report.xlsx").touch()
+
+    started = []
+
+    def fake_read(p):
+        started.append(p)
+        return pd.DataFrame({"x": [p.parent.name]}), None
+
+    seen = []
+
+    def fake_write(path, rows):
+        # 쓰기를 느리게 해 읽기가 앞서 나갈 시간을 준 뒤, 현재 리포트보다 앞서 읽은 수를 기록
+        for row in rows:
+            if row[0] != "GROUP":
+                time.sleep(0.02)
+                seen.append(len(started) - int(row[0][1:]))
+
+    monkeypatch.setattr(nm, "_read_report_safe", fake_read)
+    monkeypatch.setattr(nm, "write_rows_xlsx", fake_write)
+    assert nm.collect_to_root(root, max_workers=2) is not None
+
+    assert len(seen) == 6
+    assert max(seen) <= 1 + 2  # 현재 리포트 + 앞서 읽는 2개
+
+
+def test_report_skip_uses_input_content_not_mtime(tmp_path, capsys):
+    sub = tmp_path / "ABC"
+    sub.mkdir()
+    rows = [{1: "ABC00001A", 5: 0.33, 26: 1.5}]
+    _write_report_input(sub / "ABC.xlsx", rows)
+    nm.build_folder_report(sub)
+
+    # collect-avg처럼 같은 내용을 다시 저장 (수정 시각·문서 속성은 바뀜) → 건너뜀
+    time.sleep(1.1)
+    _write_report_input(sub / "ABC.xlsx", rows)
+    capsys.readouterr()
+    nm.build_folder_report(sub)
+    assert "건너뜀" in capsys.readouterr().out
+
+    # 내용이 바뀌면 다시 생성
+    _write_report_input(sub / "ABC.xlsx", rows + [{1: "ABC00001B", 5: 0.35}])
+    nm.build_folder_report(sub)
+    assert "건너뜀" not in capsys.readouterr().out
+    assert len(nm.read_sheet_raw(sub / "ABC_final_result_report.xlsx")) == 3
+
+
+@pytest.mark.parametrize("max_workers, n_tasks, cpus, expected", [
+    (None, 3, 8, 1),     # 자동: 작업이 적으면 프로세스 풀 없이 순차
+    (None, 16, 8, 2),    # 자동: 워커당 MIN_TASKS_PER_WORKER개
+    (None, 400, 8, 8),   # 자동: CPU 수까지
+    (3, 2, 8, 2),        # 지정: 작업 수 이하로만 제한
+    (3, 100, 8, 3),
+])
+def test_resolve_workers(monkeypatch, max_workers, n_tasks, cpus, expected):
+    monkeypatch.setattr(nm.os, "cpu_count", lambda: cpus)
+    assert nm.resolve_workers(nm.Config(max_workers=max_workers), n_tasks) == expected
+
+
+def test_report_values_match_hand_computed(tmp_path):
+    sub = tmp_path / "ABC"
+    sub.mkdir()
+    # 원본 열: 5=Att 1310 I/E, 13=MFD O/E, 14=Cutoff 2m I/E, 15=Cutoff 2m O/E, 24=Cutoff 22m,
+    #          26=R7.5mm 1550(x0.1), 81=R15mm 1550(x0.5). 둘째 행은 빈 칸/문자열 셀 포함
+    _write_report_input(sub / "ABC.xlsx", [
+        {1: "ABC00001A", 5: 0.33, 13: 9.2, 14: 1200, 15: 1250.123456, 24: 1210, 26: 1.23456, 81: 3.0},
+        {1: "ABC00001B", 13: "N/A", 14: 1300, 15: 1290, 24: 1300, 81: 2.0},
+    ], width=83)
+
+    report = nm.build_folder_report(sub)
+    rows = nm.read_sheet_raw(report).values.tolist()
+
+    assert len(rows) == 3
+    assert [t for t in rows[0] if isinstance(t, str)] == [t for t in nm.REPORT_TITLES if t]
+    col = {t: i for i, t in enumerate(nm.REPORT_TITLES) if t}
+    a, b = rows[1], rows[2]
+
+    assert a[col["spoolno2"]] == "ABC00001A" and b[col["spoolno2"]] == "ABC00001B"
+    assert a[col["Attenuation 1310 I/E"]] == pytest.approx(0.33)
+    assert pd.isna(b[col["Attenuation 1310 I/E"]])          # 빈 칸은 빈 칸 그대로
+    assert b[col["MFD 1310nm O/E"]] == "N/A"                  # 복사 열은 원본 값 유지
+    assert a[col["delta 2m-22m"]] == pytest.approx(40.1235)  # 1250.123456 - 1210, 소수 4자리
+    assert b[col["delta 2m-22m"]] == pytest.approx(-10)
+    assert a[col["Mac value"]] == pytest.approx(7.67)        # 9.2 / 1200 * 1000, 소수 2자리
+    assert pd.isna(b[col["Mac value"]])                      # 숫자가 아닌 MFD → 계산 불가
+    assert a[col["R7.5mm 1t 1550"]] == pytest.approx(0.1235)
+    assert pd.isna(b[col["R7.5mm 1t 1550"]])
+    assert a[col["R15mm 10t 1550"]] == pytest.approx(1.5)
+    assert b[col["R15mm 10t 1550"]] == pytest.approx(1.0)
+
+
+_STR_CASES = [" a ", "", "   ", None, float("nan"), 0, 1.5, "０１", "\xa0x\xa0", pd.Timestamp("2024-01-02")]
+
+
+@pytest.mark.parametrize("value", _STR_CASES)
+def test_normalize_str_series_matches_scalar(value):
+    for col in (pd.Series([value]), pd.Series([value, "x"], dtype=object)):
+        assert nm.normalize_str_series(col).tolist() == [nm.normalize_str(v) for v in col]
+
+
+@pytest.mark.parametrize("use_arrow", [True, False])
+@pytest.mark.parametrize("text", [
+    "0", "-0,00", " -0,00 ", "+ 0", " .0", "0.", "0e5", "0E-3", "00.000", "0\u3000",
+    "０", "0e٣", "\xa00", "", ".", "abc", "1,000", "0x0", "10", "0e",
+])
+def test_zero_like_mask_matches_regex(monkeypatch, use_arrow, text):
+    if use_arrow:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(nm, "HAS_PARQUET", use_arrow)
+    assert nm.zero_like_mask(pd.Series([text])).tolist() == [bool(nm.ZERO_LIKE.match(text))]
+
+
+@pytest.mark.parametrize("use_w_first", [True, False])
+@pytest.mark.parametrize("value", [
+    "ABC00001A", " abc12345b ", "ABC12345D67W89X01", "ABC12345D67W89", "ＡＢＣ１２３", "12345", "ABC",
+    "", None, float("nan"),
+])
+def test_extract_group_prefix_series_matches_scalar(use_w_first, value):
+    col = pd.Series([value, "ZZZ00001A"], dtype=object)
+    expected = [nm.extract_group_prefix(v, use_w_first) for v in col]
+    assert nm.extract_group_prefix_series(col, use_w_first).tolist() == expected